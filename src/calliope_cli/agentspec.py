@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import stat
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -10,12 +12,16 @@ from pydantic import BaseModel, Field
 from calliope_cli.exception import AgentSpecError
 
 
+@functools.cache
 def get_agents_dir() -> Path:
     return Path(__file__).parent / "agents"
 
 
 DEFAULT_AGENT_FILE = get_agents_dir() / "default" / "agent.yaml"
 
+# Prefer the libyaml-backed loader when available; fall back to the pure-Python one.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class AgentSpec(BaseModel):
     extend: str | None = Field(default=None, description="Agent file to extend")
@@ -62,13 +68,60 @@ def load_agent_spec(agent_file: Path) -> ResolvedAgentSpec:
 
 
 def _load_agent_spec(agent_file: Path) -> AgentSpec:
-    if not agent_file.exists():
-        raise AgentSpecError(f"Agent spec file not found: {agent_file}")
-    if not agent_file.is_file():
+    # Walk the `extend` chain from the child up to its root base, then fold the raw
+    # specs base -> child so that only the merged result goes through validation.
+    chain: list[dict[str, Any]] = []
+    visited: set[Path] = set()
+    current: Path | None = agent_file
+    while current is not None:
+        # Key on the resolved path: `current` keeps any `..` segments, so a cycle spelled
+        # through them would otherwise never repeat.
+        if (key := current.resolve()) in visited:
+            raise AgentSpecError(f"Circular agent spec extension: {current}")
+        visited.add(key)
+        raw = _read_agent_spec_file(current)
+        chain.append(raw)
+        match raw.get("extend"):
+            case None | "":
+                current = None
+            case "default":
+                current = DEFAULT_AGENT_FILE
+            case extend:
+                current = (current.parent / extend).absolute()
+
+    merged: dict[str, Any] = {}
+    for raw in reversed(chain):
+        for key, value in raw.items():
+            if value is None:
+                continue
+            if key == "system_prompt_args":
+                merged[key] = {**merged.get(key, {}), **value}
+            else:
+                merged[key] = value
+    merged.pop("extend", None)
+    return AgentSpec.model_validate(merged)
+
+
+def _read_agent_spec_file(agent_file: Path) -> dict[str, Any]:
+    try:
+        st = agent_file.stat()
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise AgentSpecError(f"Agent spec file not found: {agent_file}") from e
+    if not stat.S_ISREG(st.st_mode):
         raise AgentSpecError(f"Agent spec path is not a file: {agent_file}")
+    return _parse_agent_spec_file(str(agent_file), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_agent_spec_file(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse the raw `agent` section of a spec file, with paths made absolute.
+
+    Cached by path and stat fingerprint; the returned dict is shared and must not be mutated.
+    """
+    del mtime_ns, size  # only part of the cache key
+    agent_file = Path(path)
     try:
-        with open(agent_file, encoding="utf-8") as f:
-            data: dict[str, Any] = yaml.safe_load(f)
+        data: dict[str, Any] = yaml.load(agent_file.read_bytes(), Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise AgentSpecError(f"Invalid YAML in agent spec file: {e}") from e
 
@@ -76,31 +129,18 @@ def _load_agent_spec(agent_file: Path) -> AgentSpec:
     if version != 1:
         raise AgentSpecError(f"Unsupported agent spec version: {version}")
 
-    agent_spec = AgentSpec(**data.get("agent", {}))
-    if agent_spec.system_prompt_path is not None:
-        agent_spec.system_prompt_path = (
-            agent_file.parent / agent_spec.system_prompt_path
-        ).absolute()
-    if agent_spec.subagents is not None:
-        for value in agent_spec.subagents.values():
-            value.path = (agent_file.parent / value.path).absolute()
-    if agent_spec.extend:
-        if agent_spec.extend == "default":
-            base_agent_file = DEFAULT_AGENT_FILE
-        else:
-            base_agent_file = (agent_file.parent / agent_spec.extend).absolute()
-        base_agent_spec = _load_agent_spec(base_agent_file)
-        if agent_spec.name is not None:
-            base_agent_spec.name = agent_spec.name
-        if agent_spec.system_prompt_path is not None:
-            base_agent_spec.system_prompt_path = agent_spec.system_prompt_path
-        for key, value in agent_spec.system_prompt_args.items():
-            base_agent_spec.system_prompt_args[key] = value
-        if agent_spec.tools is not None:
-            base_agent_spec.tools = agent_spec.tools
-        if agent_spec.exclude_tools is not None:
-            base_agent_spec.exclude_tools = agent_spec.exclude_tools
-        if agent_spec.subagents is not None:
-            base_agent_spec.subagents = agent_spec.subagents
-        agent_spec = base_agent_spec
-    return agent_spec
+    raw: dict[str, Any] = dict(data.get("agent") or {})
+    # Resolve the base directory once; joining onto an absolute path needs no getcwd().
+    base_dir = agent_file.parent.absolute()
+    if (system_prompt_path := raw.get("system_prompt_path")) is not None:
+        raw["system_prompt_path"] = base_dir / system_prompt_path
+    if isinstance(subagents := raw.get("subagents"), dict):
+        raw["subagents"] = {
+            name: (
+                {**sub, "path": base_dir / sub["path"]}
+                if isinstance(sub, dict) and sub.get("path") is not None
+                else sub
+            )
+            for name, sub in subagents.items()
+        }
+    return raw
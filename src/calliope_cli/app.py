@@ -120,20 +120,22 @@ class CalliopeCLI:
             os.chdir(original_cwd)
 
     async def run_chat_mode(self, command: str | None = None) -> bool:
-        welcome_info = [
-            ("Directory", str(self._runtime.session.work_dir)),
-            ("Session", self._runtime.session.id),
-        ]
-        if base_url := self._env_overrides.get("KIMI_BASE_URL"):
-            welcome_info.append(("API URL", f"{base_url} (from KIMI_BASE_URL)"))
-        if self._env_overrides.get("KIMI_API_KEY"):
-            welcome_info.append(("API Key", "****** (from KIMI_API_KEY)"))
+        env = self._env_overrides
+        session = self._runtime.session
+        base_url = env.get("KIMI_BASE_URL")
         if not self._runtime.llm:
-            welcome_info.append(("Model", "not set, configure in config.json"))
-        elif "KIMI_MODEL_NAME" in self._env_overrides:
-            welcome_info.append(("Model", f"{self._soul.model_name} (from KIMI_MODEL_NAME)"))
+            model = "not set, configure in config.json"
+        elif "KIMI_MODEL_NAME" in env:
+            model = f"{self._soul.model_name} (from KIMI_MODEL_NAME)"
         else:
-            welcome_info.append(("Model", self._soul.model_name))
+            model = self._soul.model_name
+        welcome_info = [
+            ("Directory", str(session.work_dir)),
+            ("Session", session.id),
+            *([("API URL", f"{base_url} (from KIMI_BASE_URL)")] if base_url else []),
+            *([("API Key", "****** (from KIMI_API_KEY)")] if env.get("KIMI_API_KEY") else []),
+            ("Model", model),
+        ]
 
         with self._app_env():
             app = ChatApp(self._soul, welcome_info=welcome_info)
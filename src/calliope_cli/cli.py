@@ -8,8 +8,6 @@ from typing import Annotated, Any, Literal
 
 import typer
 
-from calliope_cli.constant import VERSION
-
 cli = typer.Typer(
     add_completion=False,
     context_settings={"help_option_names": ["-h", "--help"]},
@@ -21,8 +19,21 @@ InputFormat = Literal["text", "stream-json"]
 OutputFormat = Literal["text", "stream-json"]
 
 
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Use uvloop when it is installed; otherwise let asyncio pick its default loop."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def _version_callback(value: bool) -> None:
     if value:
+        from calliope_cli.constant import VERSION
+
         typer.echo(f"calliope, version {VERSION}")
         raise typer.Exit()
 
@@ -204,7 +215,7 @@ def calliope(
 
         return succeeded
 
-    succeeded = asyncio.run(_run())
+    succeeded = asyncio.run(_run(), loop_factory=_event_loop_factory())
     if not succeeded:
         sys.exit(1)
 
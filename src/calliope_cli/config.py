@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
 from typing import Self
@@ -18,6 +19,11 @@ from calliope_cli.llm import ModelCapability, ProviderType
 from calliope_cli.share import get_share_dir
 from calliope_cli.utils.logging import logger
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as _json_loads
+
 
 class LLMProvider(BaseModel):
     """LLM provider configuration."""
@@ -60,9 +66,9 @@ class Config(BaseModel):
     def validate_model(self) -> Self:
         if self.default_model and self.default_model not in self.models:
             raise ValueError(f"Default model {self.default_model} not found in models")
-        for model in self.models.values():
-            if model.provider not in self.providers:
-                raise ValueError(f"Provider {model.provider} not found in providers")
+        missing = {model.provider for model in self.models.values()} - self.providers.keys()
+        if missing:
+            raise ValueError(f"Provider {', '.join(sorted(missing))} not found in providers")
         return self
 
 
@@ -83,16 +89,25 @@ def load_config(config_file: Path | None = None) -> Config:
     logger.debug("Loading config from file: {file}", file=config_file)
 
     if not config_file.exists():
+        # Loading stays read-only; the file is only created by `save_config`.
         config = get_default_config()
-        logger.debug("No config, writing default config: {config}", config=config)
-        with open(config_file, "w", encoding="utf-8") as f:
-            f.write(config.model_dump_json(indent=2, exclude_none=True))
+        logger.debug("No config file, using default config: {config}", config=config)
         return config
 
+    stat = config_file.stat()
+    # Callers apply env overrides in place, so never hand out the cached instance.
+    return _load_config_cached(str(config_file), stat.st_mtime_ns, stat.st_size).model_copy(
+        deep=True
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> Config:
+    """Parse and validate a config file; cached by path and stat fingerprint."""
+    del mtime_ns, size  # only part of the cache key
     try:
-        with open(config_file, encoding="utf-8") as f:
-            data = json.load(f)
-        return Config(**data)
+        data = _json_loads(Path(path).read_bytes())
+        return Config.model_validate(data)
     except json.JSONDecodeError as e:
         raise ConfigError(f"Invalid JSON in configuration file: {e}") from e
     except ValidationError as e:
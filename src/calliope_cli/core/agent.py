@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import inspect
 import string
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any, get_type_hints
 
@@ -65,13 +66,33 @@ def _load_system_prompt(
     path: Path, args: dict[str, str], builtin_args: BuiltinSystemPromptArgs
 ) -> str:
     logger.info("Loading system prompt: {path}", path=path)
-    system_prompt = path.read_text(encoding="utf-8").strip()
+    template = _compile_system_prompt(str(path), path.stat().st_mtime_ns)
     logger.debug(
         "Substituting system prompt with builtin args: {builtin_args}, spec args: {spec_args}",
         builtin_args=builtin_args,
         spec_args=args,
     )
-    return string.Template(system_prompt).substitute(asdict(builtin_args), **args)
+    # Only resolve the builtin args the template references; some are computed on first access.
+    mapping = {
+        name: getattr(builtin_args, name)
+        for name in template.get_identifiers()
+        if name in _BUILTIN_ARG_NAMES and name not in args
+    }
+    return template.substitute({**mapping, **args})
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_system_prompt(path: str, mtime_ns: int) -> string.Template:
+    """Read and compile a system prompt template; cached by path and mtime."""
+    del mtime_ns  # only part of the cache key
+    return string.Template(Path(path).read_text(encoding="utf-8").strip())
+
+
+_BUILTIN_ARG_NAMES = frozenset(f.name for f in fields(BuiltinSystemPromptArgs)) | frozenset(
+    name
+    for name, attr in vars(BuiltinSystemPromptArgs).items()
+    if isinstance(attr, functools.cached_property)
+)
 
 
 type ToolType = CallableTool | CallableTool2[Any]
@@ -93,7 +114,9 @@ def _load_tools(
             toolset += tool
         else:
             bad_tools.append(tool_path)
-    logger.info("Loaded tools: {tools}", tools=[tool.name for tool in toolset.tools])
+    logger.opt(lazy=True).info(
+        "Loaded tools: {tools}", tools=lambda: [tool.name for tool in toolset.tools]
+    )
     if bad_tools:
         logger.error("Bad tools: {bad_tools}", bad_tools=bad_tools)
     return bad_tools
@@ -101,24 +124,40 @@ def _load_tools(
 
 def _load_tool(tool_path: str, dependencies: dict[type[Any], Any]) -> ToolType | None:
     logger.debug("Loading tool: {tool_path}", tool_path=tool_path)
+    cls = _resolve_tool_class(tool_path)
+    if cls is None:
+        return None
+    args: list[type[Any]] = []
+    for annotation, raw_annotation in _tool_dependency_annotations(cls):
+        if annotation not in dependencies:
+            raise ValueError(f"Tool dependency not found: {raw_annotation}")
+        args.append(dependencies[annotation])
+    return cls(*args)
+
+
+@functools.cache
+def _resolve_tool_class(tool_path: str) -> type[Any] | None:
     module_name, class_name = tool_path.rsplit(":", 1)
     try:
         module = importlib.import_module(module_name)
     except ImportError:
         return None
-    cls = getattr(module, class_name, None)
-    if cls is None:
-        return None
+    return getattr(module, class_name, None)
+
+
+@functools.cache
+def _tool_dependency_annotations(cls: type[Any]) -> tuple[tuple[Any, Any], ...]:
+    """Return `(resolved, raw)` annotations of the positional constructor parameters."""
+    module = inspect.getmodule(cls)
     try:
-        type_hints = get_type_hints(cls.__init__, globalns=module.__dict__, localns=dependencies)
+        type_hints = get_type_hints(
+            cls.__init__, globalns=module.__dict__ if module is not None else None
+        )
     except Exception:  # pragma: no cover - defensive fallback
         type_hints = {}
-    args: list[type[Any]] = []
+    annotations: list[tuple[Any, Any]] = []
     for param in inspect.signature(cls).parameters.values():
         if param.kind == inspect.Parameter.KEYWORD_ONLY:
             break
-        annotation = type_hints.get(param.name, param.annotation)
-        if annotation not in dependencies:
-            raise ValueError(f"Tool dependency not found: {param.annotation}")
-        args.append(dependencies[annotation])
-    return cls(*args)
+        annotations.append((type_hints.get(param.name, param.annotation), param.annotation))
+    return tuple(annotations)
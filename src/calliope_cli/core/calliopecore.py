@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+import random
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from functools import partial
 
@@ -19,7 +20,6 @@ from tenacity import (
     retry,
     retry_if_exception,
     stop_after_attempt,
-    wait_exponential_jitter,
 )
 
 from calliope_cli.core import LLMNotSet, MaxStepsReached, StatusSnapshot
@@ -46,6 +46,19 @@ class CalliopeRunResult:
         return self.step_result.usage
 
 
+def _precomputed_backoff(
+    attempts: int, *, initial: float, max_wait: float, jitter: float
+) -> Callable[[RetryCallState], float]:
+    """Exponential backoff with jitter, like `wait_exponential_jitter`, with bases precomputed."""
+    bases = tuple(min(initial * 2**i, max_wait) for i in range(attempts))
+
+    def wait(retry_state: RetryCallState) -> float:
+        base = bases[min(retry_state.attempt_number, len(bases)) - 1]
+        return min(base + random.uniform(0, jitter), max_wait)
+
+    return wait
+
+
 class CalliopeCore:
     """Minimal loop to drive Calliope tools/LLM."""
 
@@ -53,6 +66,19 @@ class CalliopeCore:
         self._agent = agent
         self._runtime = runtime
         self._context = context
+        self._status_cache: tuple[int, StatusSnapshot] | None = None
+        self._run_step_with_retry = retry(
+            retry=retry_if_exception(self._is_retryable_error),
+            before_sleep=partial(self._retry_log, "step"),
+            wait=_precomputed_backoff(
+                runtime.config.loop_control.max_retries_per_step,
+                initial=0.3,
+                max_wait=5,
+                jitter=0.5,
+            ),
+            stop=stop_after_attempt(runtime.config.loop_control.max_retries_per_step),
+            reraise=True,
+        )(self._run_step)
 
     @property
     def name(self) -> str:
@@ -68,7 +94,11 @@ class CalliopeCore:
 
     @property
     def status(self) -> StatusSnapshot:
-        return StatusSnapshot(context_usage=self._context_usage)
+        # The snapshot only depends on the token count, so reuse it until that changes.
+        token_count = self._context.token_count
+        if self._status_cache is None or self._status_cache[0] != token_count:
+            self._status_cache = (token_count, StatusSnapshot(context_usage=self._context_usage))
+        return self._status_cache[1]
 
     @property
     def _context_usage(self) -> float:
@@ -92,12 +122,11 @@ class CalliopeCore:
             last_step = step_result
             last_tool_results = tool_results
 
-            await self._context.append_message(step_result.message)
-            if step_result.usage:
-                await self._context.update_token_count(step_result.usage.input)
-
             # Maintain natural ordering: model message first, then tool results
-            await self._handle_tool_results(tool_results)
+            await self._context.append_batch(
+                [step_result.message, *self._tool_result_messages(tool_results)],
+                step_result.usage.input if step_result.usage else None,
+            )
 
             if not step_result.tool_calls:
                 break
@@ -111,35 +140,30 @@ class CalliopeCore:
 
     async def _step(self) -> tuple[StepResult, list[ToolResult]]:
         """Run a single LLM step with retries and return the result plus tool outputs."""
-        assert self._runtime.llm is not None
-
-        @retry(
-            retry=retry_if_exception(self._is_retryable_error),
-            before_sleep=partial(self._retry_log, "step"),
-            wait=wait_exponential_jitter(initial=0.3, max=5, jitter=0.5),
-            stop=stop_after_attempt(self._runtime.config.loop_control.max_retries_per_step),
-            reraise=True,
-        )
-        async def _run_step() -> StepResult:
-            return await kosong.step(
-                chat_provider=self._runtime.llm.chat_provider,
-                system_prompt=self._agent.system_prompt,
-                toolset=self._agent.toolset,
-                history=list(self._context.history),
-            )
-
-        result = await _run_step()
+        result = await self._run_step_with_retry()
         tool_results = await result.tool_results()
         return result, tool_results
 
-    async def _handle_tool_results(self, tool_results: Iterable):
+    async def _run_step(self) -> StepResult:
+        """A single `kosong.step` attempt; wrapped with the retry policy in `__init__`."""
+        assert self._runtime.llm is not None
+        return await kosong.step(
+            chat_provider=self._runtime.llm.chat_provider,
+            system_prompt=self._agent.system_prompt,
+            toolset=self._agent.toolset,
+            history=self._context.history,
+        )
+
+    @staticmethod
+    def _tool_result_messages(tool_results: Iterable) -> list[Message]:
+        messages: list[Message] = []
         for tool_result in tool_results:
-            message = tool_result_to_message(tool_result)
             logger.debug(
                 "Appending tool result message: {tool_call_id}",
                 tool_call_id=tool_result.tool_call_id,
             )
-            await self._context.append_message(message)
+            messages.append(tool_result_to_message(tool_result))
+        return messages
 
     @staticmethod
     def _is_retryable_error(exception: BaseException) -> bool:
@@ -117,6 +117,24 @@ class Context:
             for msg in messages:
                 await f.write(msg.model_dump_json(exclude_none=True) + "\n")
 
+    async def append_batch(self, messages: Sequence[Message], token_count: int | None = None):
+        """Append the messages of one step, plus an optional token count, in a single write."""
+        logger.debug(
+            "Appending {n} message(s) to context, token count: {token_count}",
+            n=len(messages),
+            token_count=token_count,
+        )
+        self._history.extend(messages)
+        lines = [msg.model_dump_json(exclude_none=True) + "\n" for msg in messages]
+        if token_count is not None:
+            self._token_count = token_count
+            lines.append(json.dumps({"role": "_usage", "token_count": token_count}) + "\n")
+        if not lines:
+            return
+
+        async with aiofiles.open(self._file_backend, "a", encoding="utf-8") as f:
+            await f.write("".join(lines))
+
     async def update_token_count(self, token_count: int):
         logger.debug("Updating token count in context: {token_count}", token_count=token_count)
         self._token_count = token_count
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-import asyncio
-import subprocess
+import contextlib
+import functools
+import os
+import stat
 import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -13,44 +16,120 @@ from calliope_cli.session import Session
 from calliope_cli.utils.logging import logger
 
 
-@dataclass(frozen=True, slots=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True)
 class BuiltinSystemPromptArgs:
-    """Builtin system prompt arguments available to templates."""
+    """Builtin system prompt arguments available to templates.
+
+    The work dir listing and AGENTS.md are only computed when first accessed.
+    """
 
     CALLIOPE_NOW: str
     CALLIOPE_WORK_DIR: Path
-    CALLIOPE_WORK_DIR_LS: str
-    CALLIOPE_AGENTS_MD: str
+
+    @functools.cached_property
+    def CALLIOPE_WORK_DIR_LS(self) -> str:
+        return _list_work_dir(self.CALLIOPE_WORK_DIR)
+
+    @functools.cached_property
+    def CALLIOPE_AGENTS_MD(self) -> str:
+        return load_agents_md(self.CALLIOPE_WORK_DIR) or ""
 
 
 def load_agents_md(work_dir: Path) -> str | None:
+    try:
+        dir_mtime_ns = work_dir.stat().st_mtime_ns
+    except OSError:
+        path = None  # a missing or unreadable work dir has no AGENTS.md
+    else:
+        path = _find_agents_md(work_dir, dir_mtime_ns)
+    if path is None:
+        logger.info("No AGENTS.md found in {work_dir}", work_dir=work_dir)
+        return None
+    logger.info("Loaded agents.md: {path}", path=path)
+    st = path.stat()
+    return _read_agents_md(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _find_agents_md(work_dir: Path, mtime_ns: int) -> Path | None:
+    """Locate AGENTS.md; cached by the directory mtime, which changes when entries do."""
+    del mtime_ns  # only part of the cache key
     paths = [work_dir / "AGENTS.md", work_dir / "agents.md"]
     for path in paths:
         if path.is_file():
-            logger.info("Loaded agents.md: {path}", path=path)
-            return path.read_text(encoding="utf-8").strip()
-    logger.info("No AGENTS.md found in {work_dir}", work_dir=work_dir)
+            return path
     return None
 
 
+@functools.lru_cache(maxsize=8)
+def _read_agents_md(path: Path, mtime_ns: int, size: int) -> str:
+    del mtime_ns, size  # only part of the cache key
+    return path.read_text(encoding="utf-8").strip()
+
+
 def _list_work_dir(work_dir: Path) -> str:
+    try:
+        dir_mtime_ns = work_dir.stat().st_mtime_ns
+    except OSError:
+        return ""  # nothing to list, as for an unreadable directory
+    return _list_work_dir_cached(work_dir, dir_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _list_work_dir_cached(work_dir: Path, mtime_ns: int) -> str:
+    """List the work dir; cached by the directory mtime, so only entry changes refresh it."""
+    del mtime_ns  # only part of the cache key
+    try:
+        with os.scandir(work_dir) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return ""
+    rows: list[str] = []
+    for entry in entries:
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        rows.append(_format_dir_entry(entry, st))
+    return "\n".join(rows)
+
+
+_SIX_MONTHS = 365.2425 * 24 * 60 * 60 / 2
+
+
+def _format_dir_entry(entry: os.DirEntry[str], st: os.stat_result) -> str:
+    """Format a directory entry similar to a line of `ls -la`."""
+    name = entry.name
+    if entry.is_symlink():
+        with contextlib.suppress(OSError):
+            name = f"{name} -> {os.readlink(entry.path)}"
+    mode = stat.filemode(st.st_mode)
+    # Like ls: show the time for the last six months, otherwise the year.
+    recent = 0 <= time.time() - st.st_mtime < _SIX_MONTHS
+    mtime = datetime.fromtimestamp(st.st_mtime).strftime("%b %d %H:%M" if recent else "%b %d  %Y")
     if sys.platform == "win32":
-        ls = subprocess.run(
-            ["cmd", "/c", "dir", work_dir],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-        )
-    else:
-        ls = subprocess.run(
-            ["ls", "-la", work_dir],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-        )
-    return ls.stdout.strip()
+        return f"{mode} {st.st_size:>10} {mtime} {name}"
+    owner = f"{_user_name(st.st_uid)} {_group_name(st.st_gid)}"
+    return f"{mode} {st.st_nlink:>3} {owner} {st.st_size:>8} {mtime} {name}"
+
+
+if sys.platform != "win32":
+    import grp
+    import pwd
+
+    @functools.cache
+    def _user_name(uid: int) -> str:
+        try:
+            return pwd.getpwuid(uid).pw_name
+        except KeyError:
+            return str(uid)
+
+    @functools.cache
+    def _group_name(gid: int) -> str:
+        try:
+            return grp.getgrgid(gid).gr_name
+        except KeyError:
+            return str(gid)
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -66,11 +145,6 @@ class Runtime:
         llm: LLM | None,
         session: Session,
     ) -> Runtime:
-        ls_output, agents_md = await asyncio.gather(
-            asyncio.to_thread(_list_work_dir, session.work_dir),
-            asyncio.to_thread(load_agents_md, session.work_dir),
-        )
-
         return Runtime(
             config=config,
             llm=llm,
@@ -78,7 +152,5 @@ class Runtime:
             builtin_args=BuiltinSystemPromptArgs(
                 CALLIOPE_NOW=datetime.now().astimezone().isoformat(),
                 CALLIOPE_WORK_DIR=session.work_dir,
-                CALLIOPE_WORK_DIR_LS=ls_output,
-                CALLIOPE_AGENTS_MD=agents_md or "",
             ),
         )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import functools
 import inspect
 from contextvars import ContextVar
-from typing import get_type_hints, override
+from typing import Any, get_type_hints, override
 
 from kosong.message import ToolCall
 from kosong.tooling import HandleResult, ToolReturnType
@@ -20,14 +21,7 @@ class CustomToolset(SimpleToolset):
     """Tracks the current tool call while handling execution."""
 
     def __iadd__(self, tool):  # type: ignore[override]
-        try:
-            type_hints = get_type_hints(tool.__call__)
-            return_annotation = type_hints.get(
-                "return", inspect.signature(tool.__call__).return_annotation
-            )
-        except Exception:  # pragma: no cover - defensive
-            return_annotation = inspect.signature(tool.__call__).return_annotation
-
+        return_annotation = _call_return_annotation(type(tool))
         if return_annotation is not ToolReturnType:
             raise TypeError(
                 f"Expected tool `{tool.name}` to return `ToolReturnType`, "
@@ -43,3 +37,13 @@ class CustomToolset(SimpleToolset):
             return super().handle(tool_call)
         finally:
             current_tool_call.reset(token)
+
+
+@functools.cache
+def _call_return_annotation(tool_cls: type) -> Any:
+    """Resolve the return annotation of a tool class's `__call__`, once per class."""
+    call = tool_cls.__call__
+    try:
+        return get_type_hints(call).get("return", inspect.signature(call).return_annotation)
+    except Exception:  # pragma: no cover - defensive
+        return inspect.signature(call).return_annotation
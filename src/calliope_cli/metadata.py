@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import json
-from hashlib import md5
+import os
+from functools import cached_property
+from hashlib import blake2b, md5
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -20,9 +21,16 @@ class WorkDirMeta(BaseModel):
     path: str
     last_session_id: str | None = None
 
-    @property
+    @cached_property
     def sessions_dir(self) -> Path:
-        path = get_share_dir() / "sessions" / md5(self.path.encode(encoding="utf-8")).hexdigest()
+        sessions_root = get_share_dir() / "sessions"
+        key = self.path.encode(encoding="utf-8")
+        path = sessions_root / blake2b(key, digest_size=8).hexdigest()
+        if not path.exists():
+            # Session dirs used to be named by md5; carry existing ones over on first use.
+            legacy_path = sessions_root / md5(key).hexdigest()
+            if legacy_path.is_dir():
+                legacy_path.rename(path)
         path.mkdir(parents=True, exist_ok=True)
         return path
 
@@ -40,13 +48,13 @@ def load_metadata() -> Metadata:
     if not metadata_file.exists():
         logger.debug("No metadata file found, creating empty metadata")
         return Metadata()
-    with open(metadata_file, encoding="utf-8") as f:
-        data = json.load(f)
-        return Metadata(**data)
+    return Metadata.model_validate_json(metadata_file.read_bytes())
 
 
 def save_metadata(metadata: Metadata):
     metadata_file = get_metadata_file()
     logger.debug("Saving metadata to file: {file}", file=metadata_file)
-    with open(metadata_file, "w", encoding="utf-8") as f:
-        json.dump(metadata.model_dump(), f, indent=2, ensure_ascii=False)
+    # Write to a sibling temp file and swap it in, so a crash never leaves partial metadata.
+    tmp_file = metadata_file.with_suffix(".json.tmp")
+    tmp_file.write_text(metadata.model_dump_json(indent=2), encoding="utf-8")
+    os.replace(tmp_file, metadata_file)
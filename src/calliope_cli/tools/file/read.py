@@ -1,5 +1,8 @@
+import itertools
+import re
+import stat
 from pathlib import Path
-from typing import Any, override
+from typing import Any, BinaryIO, TextIO, override
 
 from kosong.tooling import CallableTool2, ToolError, ToolOk, ToolReturnType
 from pydantic import BaseModel, Field
@@ -8,6 +11,8 @@ from calliope_cli.core.runtime import BuiltinSystemPromptArgs
 
 MAX_LINES = 1000
 MAX_BYTES = 100 << 10  # 100KB
+_CHUNK_SIZE = 64 << 10
+_LONE_CR = re.compile(rb"\r(?!\n)")
 
 
 class Params(BaseModel):
@@ -37,41 +42,120 @@ class ReadFile(CallableTool2[Params]):
                     message="Please provide an absolute path.",
                     brief="Path must be absolute",
                 )
-            if not p.exists():
+            try:
+                st = p.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 return ToolError(message=f"`{params.path}` does not exist.", brief="File not found")
-            if not p.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 return ToolError(message=f"`{params.path}` is not a file.", brief="Invalid path")
 
-            lines: list[str] = []
-            n_bytes = 0
-            with open(p, encoding="utf-8", errors="replace") as f:
-                for line_no, line in enumerate(f, start=1):
-                    if line_no < params.line_offset:
-                        continue
-                    lines.append(line)
-                    n_bytes += len(line.encode("utf-8"))
-                    if len(lines) >= params.n_lines or len(lines) >= MAX_LINES:
-                        break
-                    if n_bytes >= MAX_BYTES:
-                        break
-
-            if not lines:
+            skip, limit = params.line_offset - 1, min(params.n_lines, MAX_LINES)
+            with open(p, "rb") as f:
+                raw_lines = _read_raw_lines(f, skip=skip, limit=limit)
+            if raw_lines is None:
+                with open(p, encoding="utf-8", errors="replace") as f:
+                    raw_lines = _read_text_lines(f, skip=skip, limit=limit)
+
+            if not raw_lines:
                 return ToolOk(output="", message="No lines read from file.")
 
-            lines_with_no = [
-                f"{line_num:6d}\t{line}"
-                for line_num, line in zip(
-                    range(params.line_offset, params.line_offset + len(lines)),
-                    lines,
-                    strict=True,
-                )
-            ]
             summary = (
-                f"{len(lines)} lines read from {params.path} starting at line {params.line_offset}."
+                f"{len(raw_lines)} lines read from {params.path} "
+                f"starting at line {params.line_offset}."
             )
-            return ToolOk(output="".join(lines_with_no), message=summary)
+            return ToolOk(output=_number_raw_lines(raw_lines, params.line_offset), message=summary)
         except Exception as exc:  # pragma: no cover - defensive
             return ToolError(
                 message=f"Failed to read {params.path}. Error: {exc}",
                 brief="Failed to read file",
             )
+
+
+def _read_raw_lines(f: BinaryIO, *, skip: int, limit: int) -> list[bytes] | None:
+    """Skip `skip` lines, then read up to `limit` lines, stopping once MAX_BYTES is reached.
+
+    Works on raw bytes in fixed-size blocks so skipped lines are never decoded. A line
+    longer than MAX_BYTES is cut to its first MAX_BYTES bytes. Returns None on reaching a
+    block that may hold a lone "\r" line break, which only text mode splits on.
+    """
+    buf = b""
+    while skip:
+        buf = _read_block(f)
+        if buf is None:
+            return None
+        if not buf:
+            return []
+        n_newlines = buf.count(b"\n")
+        if n_newlines < skip:
+            skip -= n_newlines
+            continue
+        pos = -1
+        for _ in range(skip):
+            pos = buf.index(b"\n", pos + 1)
+        buf = buf[pos + 1 :]
+        skip = 0
+
+    lines: list[bytes] = []
+    n_bytes = 0
+    pos = 0
+    # Pieces of a line spanning several blocks, joined once when the line ends.
+    partial: list[bytes] = []
+    partial_len = 0
+    while len(lines) < limit and n_bytes < MAX_BYTES:
+        end = buf.find(b"\n", pos)
+        if end == -1:
+            piece = buf[pos:]
+            buf = _read_block(f)
+            if buf is None:
+                return None
+            pos = 0
+        else:
+            piece = buf[pos : end + 1]
+            pos = end + 1
+        # No single line is kept beyond MAX_BYTES; the rest of it is never buffered.
+        truncated = len(piece) > MAX_BYTES - partial_len
+        if truncated:
+            piece = piece[: MAX_BYTES - partial_len]
+        partial.append(piece)
+        partial_len += len(piece)
+        if end == -1 and buf and not truncated:
+            continue
+        if partial_len:
+            lines.append(b"".join(partial))
+            n_bytes += partial_len
+        if end == -1 or truncated:
+            break
+        partial.clear()
+        partial_len = 0
+    return lines
+
+
+def _read_block(f: BinaryIO) -> bytes | None:
+    """Read the next block, or None if it holds (or ends in) a "\r" not followed by "\n"."""
+    block = f.read(_CHUNK_SIZE)
+    if block.endswith(b"\r") or _LONE_CR.search(block) is not None:
+        return None
+    return block
+
+
+def _read_text_lines(f: TextIO, *, skip: int, limit: int) -> list[bytes]:
+    """Text-mode counterpart of `_read_raw_lines`, for files with lone "\r" line breaks."""
+    lines: list[bytes] = []
+    n_bytes = 0
+    for line in itertools.islice(f, skip, None):
+        raw = line.encode("utf-8")[:MAX_BYTES]
+        lines.append(raw)
+        n_bytes += len(raw)
+        if len(lines) >= limit or n_bytes >= MAX_BYTES:
+            break
+    return lines
+
+
+def _number_raw_lines(lines: list[bytes], start: int) -> str:
+    """Number raw lines into a single buffer and decode it once."""
+    buf = bytearray()
+    for line_no, line in enumerate(lines, start=start):
+        buf += b"%6d\t" % line_no
+        buf += line
+    # "\n" never occurs inside a UTF-8 sequence, so one decode matches per-line decoding.
+    return buf.decode("utf-8", errors="replace").replace("\r\n", "\n")
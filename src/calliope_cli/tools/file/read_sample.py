@@ -1,6 +1,13 @@
 from __future__ import annotations
 
+import codecs
+import contextlib
+import functools
+import mmap
+import os
 import random
+import re
+import stat
 from collections import deque
 from pathlib import Path
 from typing import Any, Literal, override
@@ -9,9 +16,11 @@ from kosong.tooling import CallableTool2, ToolError, ToolOk, ToolReturnType
 from pydantic import BaseModel, Field
 
 from calliope_cli.core.runtime import BuiltinSystemPromptArgs
-from calliope_cli.tools.utils import load_desc
+from calliope_cli.tools.utils import load_desc, number_lines
 
 MAX_LINES = 500
+_COUNT_BLOCK_SIZE = 1 << 20
+_LONE_CR = re.compile(rb"\r(?!\n)")
 
 
 class Params(BaseModel):
@@ -49,40 +58,43 @@ class ReadSample(CallableTool2[Params]):
         path = Path(params.path)
         if not path.is_absolute():
             return ToolError(message="Path must be absolute.", brief="Invalid path")
-        if not path.exists():
+        try:
+            st = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return ToolError(message=f"`{params.path}` does not exist.", brief="File not found")
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return ToolError(message=f"`{params.path}` is not a file.", brief="Invalid path")
 
         try:
-            encoding = params.encoding or self._detect_encoding(path)
-
-            match params.position:
-                case "head":
-                    start_line, lines = self._read_head(path, params.lines, encoding)
-                case "tail":
-                    start_line, lines = self._read_tail(path, params.lines, encoding)
-                case "middle":
-                    start_line, lines = self._read_middle(path, params.lines, encoding)
-                case "random":
-                    start_line, lines = self._read_random(path, params.lines, encoding)
-                case _:
-                    return ToolError(message=f"Unsupported position: {params.position}")
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                with (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    if size
+                    else contextlib.nullcontext(b"")
+                ) as buf:
+                    # Detect the encoding from the same mapping the sample is read from.
+                    encoding = params.encoding or _detect_encoding_from_bytes(buf[:4096])
+                    match params.position:
+                        case "head":
+                            start_line, lines = self._read_head(path, buf, params.lines, encoding)
+                        case "tail":
+                            start_line, lines = self._read_tail(path, buf, params.lines, encoding)
+                        case "middle":
+                            start_line, lines = self._read_middle(path, buf, params.lines, encoding)
+                        case "random":
+                            start_line, lines = self._read_random(path, buf, params.lines, encoding)
+                        case _:
+                            return ToolError(message=f"Unsupported position: {params.position}")
 
             if not lines:
                 return ToolOk(output="", message=f"No lines read from file (encoding: {encoding}).")
 
-            numbered = [
-                f"{line_no:6d}\t{line}"
-                for line_no, line in zip(
-                    range(start_line, start_line + len(lines)), lines, strict=True
-                )
-            ]
             summary = (
                 f"Read {len(lines)} lines from {params.position} "
                 f"starting at line {start_line} (encoding: {encoding})."
             )
-            return ToolOk(output="".join(numbered), message=summary)
+            return ToolOk(output=number_lines(lines, start_line), message=summary)
 
         except UnicodeDecodeError:
             return ToolError(
@@ -95,49 +107,29 @@ class ReadSample(CallableTool2[Params]):
                 brief="Failed to read sample",
             )
 
-    def _detect_encoding(self, path: Path) -> str:
-        """
-        Simple heuristic to detect encoding by reading the first 4KB.
-        Priority: UTF-8 -> GB18030 (Chinese) -> Latin-1
-        """
-        try:
-            with open(path, "rb") as f:
-                raw = f.read(4096)
-        except OSError:
-            return "utf-8"  # Fallback if file can't be read
-
-        # 1. Try UTF-8 (Universal)
-        try:
-            raw.decode("utf-8")
-            return "utf-8"
-        except UnicodeDecodeError:
-            pass
-
-        # 2. Try GB18030 (Superset of GBK/GB2312, common in CN novels)
-        try:
-            raw.decode("gb18030")
-            return "gb18030"
-        except UnicodeDecodeError:
-            pass
-
-        # 3. Fallback to Latin-1 (Will never raise DecodeError, but might produce garbage)
-        #    Or could fallback to utf-8 with errors='replace' in the actual read.
-        return "latin-1"
-
     def _open_text(self, path: Path, encoding: str):
         """Helper to open file with consistent error handling."""
         return open(path, encoding=encoding, errors="replace")
 
-    def _read_head(self, path: Path, n: int, encoding: str) -> tuple[int, list[str]]:
-        lines: list[str] = []
-        with self._open_text(path, encoding) as f:
-            for line in f:
-                lines.append(line)
-                if len(lines) >= n:
+    def _read_head(self, path: Path, buf: _Buffer, n: int, encoding: str) -> tuple[int, list[str]]:
+        return 1, self._read_window(path, buf, 1, n, encoding)
+
+    def _read_tail(self, path: Path, buf: _Buffer, n: int, encoding: str) -> tuple[int, list[str]]:
+        if _is_ascii_compatible(encoding):
+            if not buf:
+                return 1, []
+            # Walk backwards over at most n line breaks instead of streaming the whole file.
+            start = len(buf) - 1 if buf[-1:] == b"\n" else len(buf)
+            for _ in range(n):
+                start = buf.rfind(b"\n", 0, start)
+                if start == -1:
                     break
-        return 1, lines
+            # Only the sliced tail can hide a lone `\r`; line counting already handles one.
+            if not _has_lone_cr(buf, start + 1, len(buf)):
+                lines = _decode_lines(buf[start + 1 :], encoding)
+                total = self._count_lines(path, encoding)
+                return max(1, total - len(lines) + 1), lines
 
-    def _read_tail(self, path: Path, n: int, encoding: str) -> tuple[int, list[str]]:
         tail = deque(maxlen=n)
         _total = 0
         with self._open_text(path, encoding) as f:
@@ -146,29 +138,52 @@ class ReadSample(CallableTool2[Params]):
         start_line = max(1, _total - len(tail) + 1)
         return start_line, list(tail)
 
-    def _read_middle(self, path: Path, n: int, encoding: str) -> tuple[int, list[str]]:
+    def _read_middle(
+        self, path: Path, buf: _Buffer, n: int, encoding: str
+    ) -> tuple[int, list[str]]:
         total = self._count_lines(path, encoding)
         if total == 0:
             return 1, []
         start_line = max(1, total // 2 - n // 2 + (total % 2))
-        return start_line, self._read_window(path, start_line, n, encoding)
+        return start_line, self._read_window(path, buf, start_line, n, encoding)
 
-    def _read_random(self, path: Path, n: int, encoding: str) -> tuple[int, list[str]]:
+    def _read_random(
+        self, path: Path, buf: _Buffer, n: int, encoding: str
+    ) -> tuple[int, list[str]]:
         total = self._count_lines(path, encoding)
         if total == 0:
             return 1, []
         max_start = max(1, total - n + 1)
         start_line = random.randint(1, max_start)
-        return start_line, self._read_window(path, start_line, n, encoding)
+        return start_line, self._read_window(path, buf, start_line, n, encoding)
 
     def _count_lines(self, path: Path, encoding: str) -> int:
-        _total = 0
-        with self._open_text(path, encoding) as f:
-            for _total, _ in enumerate(f, start=1):
-                pass
-        return _total
+        st = path.stat()
+        return _count_file_lines(str(path), encoding, st.st_mtime_ns, st.st_size)
+
+    def _read_window(
+        self, path: Path, buf: _Buffer, start_line: int, n: int, encoding: str
+    ) -> list[str]:
+        if _is_ascii_compatible(encoding):
+            # Jump over skipped lines with memchr-backed find; they are never decoded.
+            start = 0
+            for _ in range(start_line - 1):
+                start = buf.find(b"\n", start) + 1
+                if start == 0:
+                    start = len(buf)
+                    break
+            end = start
+            for _ in range(n):
+                idx = buf.find(b"\n", end)
+                if idx == -1:
+                    end = len(buf)
+                    break
+                end = idx + 1
+            # A lone `\r` in the skipped or sliced bytes would move the window; later
+            # bytes cannot.
+            if not _has_lone_cr(buf, 0, end):
+                return _decode_lines(buf[start:end], encoding)
 
-    def _read_window(self, path: Path, start_line: int, n: int, encoding: str) -> list[str]:
         lines: list[str] = []
         with self._open_text(path, encoding) as f:
             for line_no, line in enumerate(f, start=1):
@@ -178,3 +193,89 @@ class ReadSample(CallableTool2[Params]):
                 if len(lines) >= n:
                     break
         return lines
+
+
+type _Buffer = mmap.mmap | bytes
+
+
+# Checked in order: the UTF-32 LE BOM starts with the UTF-16 LE one.
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _detect_encoding_from_bytes(raw: bytes) -> str:
+    """
+    Simple heuristic to detect encoding from the first bytes of a file.
+    Priority: BOM -> UTF-8 -> GB18030 (Chinese) -> Latin-1
+    """
+    for bom, encoding in _BOMS:
+        if raw.startswith(bom):
+            return encoding
+
+    # Decode incrementally with final=False so a multi-byte character cut off at the
+    # end of the prefix is not mistaken for invalid input.
+    for encoding in ("utf-8", "gb18030"):
+        try:
+            codecs.getincrementaldecoder(encoding)("strict").decode(raw, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            pass
+
+    # Fallback to Latin-1 (Will never raise DecodeError, but might produce garbage)
+    return "latin-1"
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    """Whether `\\n` is the single byte 0x0A, so lines can be located on raw bytes."""
+    try:
+        # Decode rather than encode: BOM-writing codecs such as utf-8-sig prepend the BOM.
+        return b"\n".decode(encoding) == "\n"
+    except (LookupError, UnicodeDecodeError):
+        return False
+
+
+def _has_lone_cr(buf: _Buffer, start: int, end: int) -> bool:
+    """Whether `buf[start:end]` holds a `\\r` not followed by `\\n`, a line break in text mode.
+
+    `end` must be the end of `buf` or just past a `\\n`, so no `\\r\\n` pair is cut.
+    """
+    return buf.find(b"\r", start, end) != -1 and _LONE_CR.search(buf, start, end) is not None
+
+
+def _decode_lines(raw: bytes, encoding: str) -> list[str]:
+    """Decode raw bytes into lines the way text mode would (CRLF -> LF, keep ends)."""
+    parts = raw.decode(encoding, errors="replace").replace("\r\n", "\n").split("\n")
+    last = parts.pop()
+    lines = [part + "\n" for part in parts]
+    if last:
+        lines.append(last)
+    return lines
+
+
+@functools.lru_cache(maxsize=32)
+def _count_file_lines(path: str, encoding: str, mtime_ns: int, size: int) -> int:
+    """Count lines in a file; cached by path, encoding and stat fingerprint."""
+    del mtime_ns, size  # only part of the cache key
+    if not _is_ascii_compatible(encoding):
+        _total = 0
+        with open(path, encoding=encoding, errors="replace") as f:
+            for _total, _ in enumerate(f, start=1):
+                pass
+        return _total
+
+    # Count line breaks block by block as text mode sees them (\n, \r\n or a lone \r);
+    # nothing is decoded.
+    total = 0
+    last = b"\n"
+    with open(path, "rb", buffering=0) as f:
+        for block in iter(functools.partial(f.read, _COUNT_BLOCK_SIZE), b""):
+            total += block.count(b"\n") + block.count(b"\r") - block.count(b"\r\n")
+            if last == b"\r" and block.startswith(b"\n"):
+                total -= 1  # a \r\n pair split across blocks
+            last = block[-1:]
+    return total if last in (b"\n", b"\r") else total + 1
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+import contextlib
+import functools
+import mmap
+import os
 import re
 import shutil
-import unicodedata
+import stat
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, override
 
@@ -12,6 +21,30 @@ from pydantic import BaseModel, Field
 from calliope_cli.core.runtime import BuiltinSystemPromptArgs
 from calliope_cli.tools.utils import load_desc
 
+DEFAULT_FILENAME_TEMPLATE = "{index:03d}_{title}.md"
+DEFAULT_CONTENT_TEMPLATE = "# {title}\n\n{body}"
+
+# f-string specializations of the default templates; custom templates use str.format.
+_TEMPLATE_RENDERERS: dict[str, Callable[..., str]] = {
+    DEFAULT_FILENAME_TEMPLATE: lambda *, index, title: f"{index:03d}_{title}.md",
+    DEFAULT_CONTENT_TEMPLATE: lambda *, title, body: f"# {title}\n\n{body}",
+}
+
+# Sources above this size may be memory-mapped and scanned as UTF-8 bytes.
+_MMAP_THRESHOLD = 1 << 20
+_PATTERN_TOKEN = re.compile(r"\\(.)|(.)", flags=re.DOTALL)
+_BYTE_SAFE_ESCAPES = frozenset("nt\\.^$*+?{}[]()|-/ AZ")
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]()|\\")
+_PLAIN_GROUP = re.compile(r"\(\?(?:[:=!]|<[=!]|P<)")
+
+_WRITE_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
+# Rendered chapters are handed to the writer pool once this many bytes are pending, so
+# only about two batches are held in memory at a time.
+_WRITE_BATCH_BYTES = 8 << 20
+
+# Drop characters that are illegal in filenames and turn spaces into underscores in one pass.
+_SLUG_TABLE = str.maketrans({" ": "_", **dict.fromkeys('\\/*?:"<>|')})
+
 
 class Params(BaseModel):
     source_path: str = Field(description="Path to the large source file.")
@@ -20,11 +53,11 @@ class Params(BaseModel):
     )
     split_pattern: str = Field(description="Regex to identify chapter start.")
     filename_template: str = Field(
-        default="{index:03d}_{title}.md",
+        default=DEFAULT_FILENAME_TEMPLATE,
         description="Python f-string style template for filenames. Variables: {index}, {title}.",
     )
     content_template: str = Field(
-        default="# {title}\n\n{body}",
+        default=DEFAULT_CONTENT_TEMPLATE,
         description="Template for file content. Variables: {title}, {body}.",
     )
     encoding: str | None = Field(
@@ -41,28 +74,37 @@ class SplitToWorkspace(CallableTool2[Params]):
     def __init__(self, builtin_args: BuiltinSystemPromptArgs, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._work_dir = builtin_args.CALLIOPE_WORK_DIR
+        # One writer pool per tool instance, reused across calls; shut down with the tool.
+        self._pool = ThreadPoolExecutor(
+            max_workers=_WRITE_CONCURRENCY, thread_name_prefix="split-write"
+        )
+        weakref.finalize(self, self._pool.shutdown, wait=False)
 
     @override
     async def __call__(self, params: Params) -> ToolReturnType:
         source_path = self._resolve_path(params.source_path)
         workspace_path = self._resolve_path(params.workspace_path)
 
-        if not source_path.exists():
+        try:
+            st = source_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return ToolError(message=f"`{source_path}` does not exist.", brief="File not found")
-        if not source_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return ToolError(message=f"`{source_path}` is not a file.", brief="Invalid path")
 
         # 1. Detect encoding
-        encoding = params.encoding or self._detect_encoding(source_path)
+        encoding = params.encoding or _detect_encoding(str(source_path), st.st_mtime_ns, st.st_size)
 
         try:
-            pattern = re.compile(f"({params.split_pattern})", flags=re.MULTILINE)
+            pattern = _compile_split(params.split_pattern)
         except re.error as exc:
             return ToolError(message=f"Invalid regex: {exc}", brief="Regex error")
 
         try:
             # 2. Read file using detected encoding
-            content = source_path.read_text(encoding=encoding)
+            content, matches = _scan_source(
+                source_path, st.st_size, encoding, params.split_pattern, pattern
+            )
         except (UnicodeDecodeError, LookupError, ValueError):
             return ToolError(
                 message=f"Failed to decode file `{source_path}` with encoding `{encoding}`. Try specifying a different encoding.",
@@ -71,25 +113,32 @@ class SplitToWorkspace(CallableTool2[Params]):
         except OSError as exc:
             return ToolError(message=f"Failed to read source: {exc}", brief="Read error")
 
+        try:
+            return await self._split(params, content, matches, encoding, workspace_path)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+    async def _split(
+        self,
+        params: Params,
+        content: str | mmap.mmap,
+        matches: list[re.Match[str]] | list[re.Match[bytes]],
+        encoding: str,
+        workspace_path: Path,
+    ) -> ToolReturnType:
         # 3. Business logic for splitting
-        split_parts = pattern.split(content)
-
-        # pattern.split with capturing group creates list structure like:
-        # [preface, title1, body1, title2, body2, ...]
-        headings = split_parts[1::2]
-        bodies = split_parts[2::2]
-
-        # Edge case: if regex is not perfect, bodies might be fewer than headings
-        if len(bodies) < len(headings):
-            bodies = [*bodies, *([""] * (len(headings) - len(bodies)))]
-
-        if not headings:
+        # Locate headings with finditer and slice each body out of `content` only when it
+        # is written, instead of materializing every heading and body via pattern.split.
+        if not matches:
             return ToolError(
                 message=f"No matches found for regex `{params.split_pattern}` with encoding `{encoding}`.",
-                brief="No matches found"
+                brief="No matches found",
             )
+        body_ends = [match.start() for match in matches[1:]]
+        body_ends.append(len(content))
 
-        preface = split_parts[0].strip("\n\r")
+        preface = _text(content[: matches[0].start()]).strip("\n\r")
 
         try:
             self._prepare_workspace(workspace_path)
@@ -98,67 +147,67 @@ class SplitToWorkspace(CallableTool2[Params]):
         except OSError as exc:
             return ToolError(message=f"Failed to prepare workspace: {exc}", brief="Workspace error")
 
+        render_filename = _template_renderer(params.filename_template)
+        render_content = _template_renderer(params.content_template)
         written = 0
+        # Render files into bounded batches. Each full batch is handed to the writer pool
+        # straight away and written while the next one renders. Keyed by filename so a
+        # repeated name keeps the last rendered content, as sequential writes would;
+        # batches are written strictly in order.
+        pending: dict[str, bytes] = {}
+        pending_bytes = 0
+        in_flight: asyncio.Future[list[None]] | None = None
+        error: ToolError | None = None
         # Write Preface (always use UTF-8 for new workspace files)
         if preface:
-            self._write_file(
-                workspace_path,
-                filename=params.filename_template.format(index=0, title="preface"),
-                content=preface,
-            )
+            pending[render_filename(index=0, title="preface")] = encoded = preface.encode()
+            pending_bytes += len(encoded)
             written += 1
 
-        for idx, (title, body) in enumerate(zip(headings, bodies, strict=True), start=1):
-            title = title.strip()
-            safe_title = self._slugify(title)
+        for idx, (match, body_end) in enumerate(zip(matches, body_ends, strict=True), start=1):
+            title, safe_title = self._slugify(_text(match.group(1)))
+            body = _text(content[match.end() : body_end])
             try:
-                filename = params.filename_template.format(index=idx, title=safe_title)
+                filename = render_filename(index=idx, title=safe_title)
             except Exception as exc:  # noqa: BLE001
-                return ToolError(
+                error = ToolError(
                     message=f"Filename template failed to render: {exc}",
                     brief="Template error",
                 )
+                break
             try:
-                file_content = params.content_template.format(title=title, body=body)
+                file_content = render_content(title=title, body=body)
             except Exception as exc:  # noqa: BLE001
-                return ToolError(
+                error = ToolError(
                     message=f"Content template failed to render: {exc}",
                     brief="Template error",
                 )
-            self._write_file(workspace_path, filename=filename, content=file_content)
+                break
+            pending[filename] = encoded = file_content.encode()
+            pending_bytes += len(encoded)
             written += 1
-
-        preview = ", ".join(headings[:5])
+            if pending_bytes >= _WRITE_BATCH_BYTES:
+                if in_flight is not None:
+                    await in_flight
+                in_flight = self._write_files(workspace_path, pending)
+                pending = {}
+                pending_bytes = 0
+
+        # Files rendered before a template error are still written.
+        if in_flight is not None:
+            await in_flight
+        await self._write_files(workspace_path, pending)
+        if error is not None:
+            return error
+
+        preview = ", ".join(_text(match.group(1)) for match in matches[:5])
         return ToolOk(
             output=f"Successfully split source (encoding: {encoding}) into {written} file(s) at {workspace_path}",
             message=f"Examples: {preview}",
         )
 
-    def _detect_encoding(self, path: Path) -> str:
-        """
-        Heuristic to detect encoding (UTF-8 -> GB18030 -> Latin-1).
-        """
-        try:
-            with open(path, "rb") as f:
-                raw = f.read(4096)
-        except OSError:
-            return "utf-8"
-
-        try:
-            raw.decode("utf-8")
-            return "utf-8"
-        except UnicodeDecodeError:
-            pass
-
-        try:
-            raw.decode("gb18030")
-            return "gb18030"
-        except UnicodeDecodeError:
-            pass
-
-        return "latin-1"
-
-    def _slugify(self, text: str, max_len: int = 48) -> str:
+    def _slugify(self, text: str, max_len: int = 48) -> tuple[str, str]:
+        """Return the stripped title and its filesystem-safe slug."""
         # Note: This preserves the existing slugify logic but has limited Chinese support
         # If you want to preserve Chinese characters in filenames, you can simplify this function
         # The current logic removes Chinese characters and keeps only Latin characters, which is not suitable for Chinese novels
@@ -166,11 +215,9 @@ class SplitToWorkspace(CallableTool2[Params]):
 
         # --- Improved Slugify (allows Chinese) ---
         text = text.strip()
-        # Replace illegal filesystem characters
-        safe_text = re.sub(r'[\\/*?:"<>|]', "", text)
-        # Replace spaces with underscores
-        safe_text = safe_text.replace(" ", "_")
-        return safe_text[:max_len] or "chapter"
+        # Remove illegal filesystem characters and replace spaces with underscores
+        safe_text = text.translate(_SLUG_TABLE)
+        return text, safe_text[:max_len] or "chapter"
 
     def _resolve_path(self, raw: str) -> Path:
         path = Path(raw)
@@ -187,13 +234,221 @@ class SplitToWorkspace(CallableTool2[Params]):
         # This check is somewhat weak, suggested improvement:
         # Ensure workspace_path is inside work_dir or is an obvious subdirectory
 
-        if resolved.exists():
+        # rmtree reports a missing workspace itself; no separate exists() stat needed.
+        with contextlib.suppress(FileNotFoundError):
             shutil.rmtree(resolved)
-        resolved.mkdir(parents=True, exist_ok=True)
+        resolved.mkdir(parents=True)
+
+    def _write_files(self, base: Path, files: dict[str, bytes]) -> asyncio.Future[list[None]]:
+        """Submit files to the tool's thread pool, one batch of files per worker.
 
-    def _write_file(self, base: Path, filename: str, content: str) -> None:
-        # Output files always use UTF-8, which is best practice
-        (base / filename).write_text(content, encoding="utf-8")
+        The writes start immediately; the returned future completes once all are done.
+        """
+        items = list(files.items())
+        n_batches = min(_WRITE_CONCURRENCY, len(items))
+        loop = asyncio.get_running_loop()
+        return asyncio.gather(
+            *(
+                loop.run_in_executor(self._pool, self._write_batch, base, items[i::n_batches])
+                for i in range(n_batches)
+            )
+        )
+
+    def _write_batch(self, base: Path, batch: list[tuple[str, bytes]]) -> None:
+        for filename, content in batch:
+            self._write_file(base, filename, content)
+
+    def _write_file(self, base: Path, filename: str, content: bytes) -> None:
+        # Output files always use UTF-8, which is best practice; content arrives pre-encoded.
+        # The whole file is a single write, so skip the BufferedWriter copy.
+        with open(base / filename, "wb", buffering=0) as f:
+            view = memoryview(content)
+            while view:
+                view = view[f.write(view) :]
+
+
+def _template_renderer(template: str) -> Callable[..., str]:
+    return _TEMPLATE_RENDERERS.get(template, template.format)
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_encoding(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Heuristic to detect encoding (UTF-8 -> GB18030 -> Latin-1).
+    Cached by path and stat fingerprint.
+    """
+    del mtime_ns, size  # only part of the cache key
+    try:
+        with open(path, "rb") as f:
+            raw = f.read(4096)
+    except OSError:
+        return "utf-8"
+
+    # Pure ASCII is valid UTF-8; skip the full decode.
+    if raw.isascii():
+        return "utf-8"
+
+    try:
+        raw.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    try:
+        raw.decode("gb18030")
+        return "gb18030"
+    except UnicodeDecodeError:
+        pass
+
+    return "latin-1"
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_split(split_pattern: str) -> re.Pattern[str]:
+    """Compile a chapter-start regex wrapped in a capturing group; cached per pattern."""
+    return re.compile(f"({split_pattern})", flags=re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_split_bytes(split_pattern: str) -> re.Pattern[bytes] | None:
+    """Bytes twin of `_compile_split` for byte-safe patterns, or None if there is none."""
+    if not split_pattern.isascii():
+        return None
+    for token in _PATTERN_TOKEN.finditer(split_pattern):
+        escaped, char = token.groups()
+        # `.`, `\w`-style classes, negated sets, `\x`/octal escapes and inline flags can match
+        # differently (or match part of a multi-byte character) on bytes than on text.
+        if (
+            (escaped is not None and escaped not in _BYTE_SAFE_ESCAPES)
+            or char == "."
+            or (char == "[" and split_pattern.startswith("^", token.end()))
+            or (
+                char == "("
+                and split_pattern.startswith("?", token.end())
+                and not _PLAIN_GROUP.match(split_pattern, token.start())
+            )
+        ):
+            return None
+    return re.compile(f"({split_pattern})".encode("ascii"), flags=re.MULTILINE)
+
+
+def _scan_source(
+    path: Path, size: int, encoding: str, split_pattern: str, pattern: re.Pattern[str]
+) -> tuple[str, list[re.Match[str]]] | tuple[mmap.mmap, list[re.Match[bytes]]]:
+    """Return the source content and the split matches over it.
+
+    Large UTF-8 sources split by a byte-safe pattern are memory-mapped and scanned as bytes,
+    so chapters are decoded one at a time; everything else is read and decoded in full.
+    """
+    literal = _line_start_literal(split_pattern)
+    if size > _MMAP_THRESHOLD and codecs.lookup(encoding).name == "utf-8":
+        bytes_pattern = _compile_split_bytes(split_pattern)
+        if bytes_pattern is not None:
+            # Byte-safe patterns are ASCII, and so is any literal taken from them.
+            bytes_literal = literal.encode("ascii") if literal is not None else None
+            if mapped := _scan_mapped(path, bytes_pattern, bytes_literal):
+                return mapped
+    content = path.read_text(encoding=encoding)
+    return content, _find_matches(pattern, content, literal)
+
+
+def _scan_mapped(
+    path: Path, pattern: re.Pattern[bytes], literal: bytes | None
+) -> tuple[mmap.mmap, list[re.Match[bytes]]] | None:
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        # Text mode would translate "\r\n"; only LF-only sources give identical slices.
+        if mm.find(b"\r") != -1:
+            mm.close()
+            return None
+        # Fail on invalid UTF-8 up front, as read_text would, without keeping the text.
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for offset in range(0, len(mm), _MMAP_THRESHOLD):
+            decoder.decode(mm[offset : offset + _MMAP_THRESHOLD])
+        decoder.decode(b"", final=True)
+        matches = _find_matches_bytes(pattern, mm, literal)
+    except BaseException:
+        mm.close()
+        raise
+    # A match edge inside a multi-byte character (e.g. an empty match) has no text equivalent.
+    if any(_is_continuation(mm, m.start()) or _is_continuation(mm, m.end()) for m in matches):
+        mm.close()
+        return None
+    return mm, matches
+
+
+@functools.lru_cache(maxsize=128)
+def _line_start_literal(split_pattern: str) -> str | None:
+    """The literal of a `^literal` split pattern, or None for any other pattern."""
+    if not split_pattern.startswith("^"):
+        return None
+    chars: list[str] = []
+    for escaped, char in _PATTERN_TOKEN.findall(split_pattern[1:]):
+        if escaped:
+            if escaped.isalnum():
+                return None
+            chars.append(escaped)
+        elif char in _REGEX_SPECIAL:
+            return None
+        else:
+            chars.append(char)
+    return "".join(chars) or None
+
+
+def _find_matches(
+    pattern: re.Pattern[str], content: str, literal: str | None
+) -> list[re.Match[str]]:
+    """`pattern.finditer(content)`, with `^literal` patterns located by substring search.
+
+    The regex engine tries every position for a line-anchored pattern, while `find` on
+    `"\\n" + literal` skips straight to candidate line starts.
+    """
+    if literal is None:
+        return list(pattern.finditer(content))
+    starts = [0] if content.startswith(literal) else []
+    needle = "\n" + literal
+    pos = content.find(needle)
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = content.find(needle, pos + 1)
+    return _match_at_starts(functools.partial(pattern.match, content), starts)
+
+
+def _find_matches_bytes(
+    pattern: re.Pattern[bytes], content: mmap.mmap, literal: bytes | None
+) -> list[re.Match[bytes]]:
+    """Bytes counterpart of `_find_matches`, over a memory-mapped source."""
+    if literal is None:
+        return list(pattern.finditer(content))
+    starts = [0] if content[: len(literal)] == literal else []
+    needle = b"\n" + literal
+    pos = content.find(needle)
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = content.find(needle, pos + 1)
+    return _match_at_starts(functools.partial(pattern.match, content), starts)
+
+
+def _match_at_starts[T: (str, bytes)](
+    match_at: Callable[[int], re.Match[T] | None], starts: list[int]
+) -> list[re.Match[T]]:
+    matches: list[re.Match[T]] = []
+    end = 0
+    for start in starts:
+        # Skip candidates overlapping the previous match, as finditer would.
+        if start >= end and (match := match_at(start)) is not None:
+            matches.append(match)
+            end = match.end()
+    return matches
+
+
+def _is_continuation(mm: mmap.mmap, offset: int) -> bool:
+    return offset < len(mm) and 0x80 <= mm[offset] < 0xC0
+
+
+def _text(chunk: str | bytes) -> str:
+    return chunk if isinstance(chunk, str) else chunk.decode("utf-8")
 
 
 # Backward compatibility for existing tool registrations.
@@ -1,10 +1,25 @@
+import functools
 import string
+from collections.abc import Sequence
 from pathlib import Path
 
 
 def load_desc(path: Path, substitutions: dict[str, str] | None = None) -> str:
     """Load a tool description from a file, with optional substitutions."""
-    description = path.read_text(encoding="utf-8")
+    description = _read_desc(path)
     if substitutions:
         description = string.Template(description).substitute(substitutions)
     return description
+
+
+@functools.cache
+def _read_desc(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+_NUMBERED_LINE = "{:6d}\t{}".format
+
+
+def number_lines(lines: Sequence[str], start: int) -> str:
+    """Prefix each line with its right-aligned line number and a tab, then join them."""
+    return "".join(map(_NUMBERED_LINE, range(start, start + len(lines)), lines))
@@ -1,22 +1,18 @@
 from __future__ import annotations
 
+import functools
 import inspect
+import re
 import shlex
 import tempfile
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from kosong.message import Message
 from kosong.tooling import ToolError, ToolOk
-from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import merge_completers
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.table import Table
 
 from calliope_cli.core.calliopecore import CalliopeCore
 from calliope_cli.core.context import Context
-from calliope_cli.ui.chat.completers import FileMentionCompleter, MetaCommandCompleter
 from calliope_cli.ui.chat.metacmd import (
     get_meta_command,
     get_meta_commands,
@@ -24,7 +20,24 @@ from calliope_cli.ui.chat.metacmd import (
 )
 from calliope_cli.utils.message import message_stringify
 
-console = Console()
+_SHLEX_SPECIAL = frozenset("\"'\\")
+# shlex splits only on ASCII whitespace, unlike str.split (e.g. U+3000 stays in a token).
+_PLAIN_TOKEN = re.compile(r"[^ \t\r\n]+")
+
+if TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
+    from rich.console import Console
+    from rich.markdown import Markdown
+    from rich.table import Table
+
+
+# Rich and prompt_toolkit are imported on first use so one-shot commands skip the
+# interactive UI stack at startup.
+@functools.cache
+def _console() -> Console:
+    from rich.console import Console
+
+    return Console()
 
 
 class ChatApp:
@@ -33,18 +46,30 @@ class ChatApp:
     def __init__(self, soul: CalliopeCore, welcome_info: list[tuple[str, str]] | None = None):
         self._soul = soul
         self._welcome_info = welcome_info or []
-        self._session = PromptSession(
-            completer=merge_completers(
-                [MetaCommandCompleter(), FileMentionCompleter(Path.cwd())],
-                deduplicate=True,
-            ),
-            complete_while_typing=True,
-        )
+        # Built once; run() may be called more than once on the same app.
+        self._welcome_table = _welcome_table(self._welcome_info) if self._welcome_info else None
+        self._session: PromptSession[str] | None = None
+
+    def _prompt_session(self) -> PromptSession[str]:
+        if self._session is None:
+            from prompt_toolkit import PromptSession
+            from prompt_toolkit.completion import merge_completers
+
+            from calliope_cli.ui.chat.completers import FileMentionCompleter, MetaCommandCompleter
+
+            self._session = PromptSession(
+                completer=merge_completers(
+                    [MetaCommandCompleter(), FileMentionCompleter(Path.cwd())],
+                    deduplicate=True,
+                ),
+                complete_while_typing=True,
+            )
+        return self._session
 
     async def run(self, command: str | None = None) -> bool:
         """Run chat mode. If command is provided, run once; otherwise start loop."""
-        if self._welcome_info:
-            _render_welcome(self._welcome_info)
+        if self._welcome_table is not None:
+            _console().print(self._welcome_table)
         if command:
             command = command.strip()
             if command.startswith("/"):
@@ -53,15 +78,16 @@ class ChatApp:
             _render_response(result.message.content)
             return True
 
-        console.print(
+        _console().print(
             "[italic]Type your message or slash command. Use /help for commands, /exit to quit.[/]"
         )
+        session = self._prompt_session()
         try:
             while True:
                 try:
-                    text = (await self._session.prompt_async("> ")).strip()
+                    text = (await session.prompt_async("> ")).strip()
                 except KeyboardInterrupt:
-                    console.print("[yellow]^C[/] to exit; type /exit to quit.")
+                    _console().print("[yellow]^C[/] to exit; type /exit to quit.")
                     continue
                 if not text:
                     continue
@@ -73,15 +99,20 @@ class ChatApp:
                 result = await self._soul.run(text)
                 _render_response(result.message.content)
         except EOFError:
-            console.print()
+            _console().print()
             return True
         return True
 
     async def _handle_meta(self, command: str) -> bool:
         """Parse and dispatch slash commands via registry."""
-        tokens = shlex.split(command)
+        # Plain commands need no shell-style parsing; shlex is much slower than a regex.
+        tokens = (
+            _PLAIN_TOKEN.findall(command)
+            if _SHLEX_SPECIAL.isdisjoint(command)
+            else shlex.split(command)
+        )
         if not tokens:
-            console.print("[red]Empty command[/]")
+            _console().print("[red]Empty command[/]")
             return False
 
         cmd = tokens[0].lstrip("/").lower()
@@ -89,13 +120,16 @@ class ChatApp:
 
         meta = get_meta_command(cmd)
         if meta is None:
-            console.print(f"[red]Unknown command: /{cmd}[/]")
+            _console().print(f"[red]Unknown command: /{cmd}[/]")
             _render_help()
             return False
 
-        result = meta.func(self, args)
-        if inspect.isawaitable(result):
-            result = await result
+        if meta.is_coroutine:
+            result = await meta.func(self, args)  # type: ignore[misc]
+        else:
+            result = meta.func(self, args)
+            if inspect.isawaitable(result):
+                result = await result
         return True if result is None else bool(result)
 
     async def _call_tool(
@@ -104,29 +138,35 @@ class ChatApp:
         target_core = core or self._soul
         tool = next((t for t in target_core.toolset.tools if t.name == tool_name), None)
         if tool is None:
-            console.print(f"[red]Tool not available: {tool_name}[/]")
+            _console().print(f"[red]Tool not available: {tool_name}[/]")
             return False
         try:
             params = tool.params(**{k: v for k, v in kwargs.items() if v is not None})
         except Exception as exc:  # pragma: no cover - defensive
-            console.print(f"[red]Invalid arguments for {tool_name}: {exc}[/]")
+            _console().print(f"[red]Invalid arguments for {tool_name}: {exc}[/]")
             return False
 
         result = await tool(params)
         if isinstance(result, ToolError):
-            console.print(f"[red]{result.brief or 'Tool error'}[/]\n{result.message}")
+            error = f"[red]{result.brief or 'Tool error'}[/]\n{result.message}"
             if result.output:
-                console.print(result.output)
+                _console().print(error, result.output, sep="\n")
+            else:
+                _console().print(error)
             return False
 
         if isinstance(result, ToolOk):
+            # One print per result: rich renders and writes it in a single pass.
+            renderables: list[Any] = []
             if result.message:
-                console.print(result.message)
+                renderables.append(result.message)
             if result.output:
-                _render_response(result.output)
+                renderables.append(_response_markdown(result.output))
+            if renderables:
+                _console().print(*renderables)
             return True
 
-        console.print(f"[yellow]Tool returned unexpected result: {result}[/]")
+        _console().print(f"[yellow]Tool returned unexpected result: {result}[/]")
         return False
 
     async def _call_tool_in_temp_context(self, tool_name: str, **kwargs: Any) -> bool:
@@ -141,29 +181,44 @@ class ChatApp:
             return await self._call_tool(tool_name, core=temp_core, **kwargs)
 
 
-def _render_welcome(rows: list[tuple[str, str]]) -> None:
+def _welcome_table(rows: list[tuple[str, str]]) -> Table:
+    from rich.table import Table
+
     table = Table(show_header=False, box=None, pad_edge=False)
     table.add_column("field", style="cyan", no_wrap=True)
     table.add_column("value")
     for name, value in rows:
         table.add_row(name, value)
-    console.print(table)
+    return table
 
 
 def _render_response(content: Any) -> None:
+    _console().print(_response_markdown(content))
+
+
+def _response_markdown(content: Any) -> Markdown:
+    from rich.markdown import Markdown
+
     text: str
     match content:
         case str(raw):
             text = raw
         case _:
             text = message_stringify(Message(role="assistant", content=content))
-    console.print(Markdown(text))
+    return Markdown(text)
 
 
 def _render_help() -> None:
-    console.print(
-        Markdown(
-            """
+    _console().print(_help_markdown())
+
+
+@functools.cache
+def _help_markdown() -> Markdown:
+    """The help text is constant, so it is parsed into Markdown only once."""
+    from rich.markdown import Markdown
+
+    return Markdown(
+        """
 **Slash commands**
 1. `/help` — show this help
 2. `/index <path> [--chunk N --overlap M]` — build RAG index (stub)
@@ -173,7 +228,6 @@ def _render_help() -> None:
 6. `/rewrite "draft" [--style tone]` — rewrite/merge draft (stub)
 Use `/help-all` to list commands with aliases.
 """
-        )
     )
 
 
@@ -187,88 +241,101 @@ def help(app: ChatApp, args: list[str]):
 @meta_command
 async def index(app: ChatApp, args: list[str]):
     """Build RAG index (stub)."""
-    if not args:
-        console.print("[red]Usage: /index <path> [--chunk 1500 --overlap 200][/]")
+    positional, flags = _parse_args(args)
+    if not positional:
+        _console().print("[red]Usage: /index <path> [--chunk 1500 --overlap 200][/]")
         return False
     return await app._call_tool_in_temp_context(
         "RAGIndex",
-        path=args[0],
-        chunk_size=_get_int_arg(args, "--chunk", 1500),
-        chunk_overlap=_get_int_arg(args, "--overlap", 200),
+        path=positional[0],
+        chunk_size=_int_flag(flags, "--chunk", 1500),
+        chunk_overlap=_int_flag(flags, "--overlap", 200),
     )
 
 
 @meta_command
 async def search(app: ChatApp, args: list[str]):
     """Search indexed content (stub)."""
-    if not args:
-        console.print('[red]Usage: /search "query" [--top 5][/]')
+    positional, flags = _parse_args(args)
+    if not positional:
+        _console().print('[red]Usage: /search "query" [--top 5][/]')
         return False
     return await app._call_tool_in_temp_context(
         "RAGSearch",
-        query=" ".join(a for a in args if not a.startswith("--")),
-        top_k=_get_int_arg(args, "--top", 5),
+        query=" ".join(positional),
+        top_k=_int_flag(flags, "--top", 5),
     )
 
 
 @meta_command
 async def outline(app: ChatApp, args: list[str]):
     """Generate outline (stub)."""
-    if not args:
-        console.print('[red]Usage: /outline "title" [--focus audience][/]')
+    positional, flags = _parse_args(args)
+    if not positional:
+        _console().print('[red]Usage: /outline "title" [--focus audience][/]')
         return False
-    focus = _get_str_arg(args, "--focus")
-    return await app._call_tool_in_temp_context("Outline", title=" ".join(args), focus=focus)
+    return await app._call_tool_in_temp_context(
+        "Outline", title=" ".join(positional), focus=flags.get("--focus")
+    )
 
 
 @meta_command
 async def summarize(app: ChatApp, args: list[str]):
     """Summarize a section (stub)."""
-    if not args:
-        console.print('[red]Usage: /summarize "section"[/]')
+    positional, _ = _parse_args(args)
+    if not positional:
+        _console().print('[red]Usage: /summarize "section"[/]')
         return False
-    return await app._call_tool_in_temp_context("Summarize", section=" ".join(args), sources=None)
+    return await app._call_tool_in_temp_context(
+        "Summarize", section=" ".join(positional), sources=None
+    )
 
 
 @meta_command
 async def rewrite(app: ChatApp, args: list[str]):
     """Rewrite or merge a draft (stub)."""
-    if not args:
-        console.print('[red]Usage: /rewrite "draft" [--style tone][/]')
+    positional, flags = _parse_args(args)
+    if not positional:
+        _console().print('[red]Usage: /rewrite "draft" [--style tone][/]')
         return False
-    style = _get_str_arg(args, "--style")
-    draft = " ".join(a for a in args if not a.startswith("--"))
-    return await app._call_tool_in_temp_context("Rewrite", draft=draft, style=style)
+    return await app._call_tool_in_temp_context(
+        "Rewrite", draft=" ".join(positional), style=flags.get("--style")
+    )
 
 
 @meta_command(name="help-all")
 def list_meta_commands(app: ChatApp, args: list[str]):
     """List meta commands with aliases."""
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="cyan", box=None, pad_edge=False)
     table.add_column("Command", no_wrap=True)
     table.add_column("Description")
     for cmd in get_meta_commands():
-        names = ", ".join(f"/{n}" for n in cmd.all_names())
+        names = ", ".join(f"/{n}" for n in cmd.all_names)
         table.add_row(names, cmd.description or "")
-    console.print(table)
+    _console().print(table)
     return True
 
 
-def _get_int_arg(args: list[str], flag: str, default: int) -> int:
-    if flag not in args:
-        return default
-    try:
-        idx = args.index(flag)
-        return int(args[idx + 1])
-    except Exception:
-        return default
+def _parse_args(args: list[str]) -> tuple[list[str], dict[str, str]]:
+    """Split args into positionals and `--flag value` pairs in one pass.
+
+    The first occurrence of a flag wins; a trailing flag without a value is dropped.
+    """
+    positional: list[str] = []
+    flags: dict[str, str] = {}
+    tokens = iter(args)
+    for token in tokens:
+        if not token.startswith("--"):
+            positional.append(token)
+        elif (value := next(tokens, None)) is not None:
+            flags.setdefault(token, value)
+    return positional, flags
 
 
-def _get_str_arg(args: list[str], flag: str) -> str | None:
-    if flag not in args:
-        return None
+def _int_flag(flags: dict[str, str], flag: str, default: int) -> int:
     try:
-        idx = args.index(flag)
-        return args[idx + 1]
-    except Exception:
-        return None
+        return int(flags[flag])
+    except (KeyError, ValueError):
+        return default
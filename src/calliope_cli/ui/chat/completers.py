@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import os
 import re
+import threading
 import time
 from pathlib import Path
 
@@ -13,7 +15,7 @@ from prompt_toolkit.completion import (
 )
 from prompt_toolkit.document import Document
 
-from calliope_cli.ui.chat.metacmd import get_meta_commands
+from calliope_cli.ui.chat.metacmd import get_sorted_meta_commands
 
 
 class MetaCommandCompleter(Completer):
@@ -35,13 +37,12 @@ class MetaCommandCompleter(Completer):
         typed = token[1:]
         typed_lower = typed.lower()
 
-        for cmd in sorted(get_meta_commands(), key=lambda c: c.name):
-            names = [cmd.name, *cmd.aliases]
-            if typed == "" or any(name.lower().startswith(typed_lower) for name in names):
+        for cmd in get_sorted_meta_commands():
+            if typed == "" or any(name.startswith(typed_lower) for name in cmd.lower_names):
                 yield Completion(
                     text=f"/{cmd.name}",
                     start_position=-len(token),
-                    display=cmd.slash_name(),
+                    display=cmd.slash_name,
                     display_meta=cmd.description,
                 )
 
@@ -50,6 +51,7 @@ class FileMentionCompleter(Completer):
     """Provide fuzzy `@` path completion within the current working directory."""
 
     _FRAGMENT_PATTERN = re.compile(r"[^\s@]+")
+    _FUZZY_PATTERN = r"^[^\s@]*"
     _TRIGGER_GUARDS = frozenset((".", "-", "_", "`", "'", '"', ":", "@", "#", "~"))
     _IGNORED_NAMES = frozenset(
         (
@@ -84,27 +86,26 @@ class FileMentionCompleter(Completer):
         "|".join(f"(?:{part})" for part in _IGNORED_PATTERN_PARTS),
         re.IGNORECASE,
     )
+    # Last characters any `_IGNORED_PATTERN_PARTS` match can end with (case-folded, so
+    # including U+017F and U+212A). Names ending otherwise skip the regex.
+    _IGNORED_LAST_CHARS = frozenset("CEKOPScekops~\u017f\u212a")
 
     def __init__(self, root: Path, *, refresh_interval: float = 2.0, limit: int = 1000) -> None:
-        self._root = root
+        # The root never changes; keep it as a str for the os.path/os.scandir hot paths.
+        self._root_str = os.fspath(root)
         self._refresh_interval = refresh_interval
         self._limit = limit
         self._cache_time = 0.0
         self._cached_paths: list[str] = []
+        self._deep_refresh_in_flight = False
         self._top_cache_time = 0.0
         self._top_cached_paths: list[str] = []
-        self._fragment_hint: str | None = None
-
-        self._word_completer = WordCompleter(
-            self._get_paths,
-            WORD=False,
-            pattern=self._FRAGMENT_PATTERN,
-        )
-        self._fuzzy = FuzzyCompleter(
-            self._word_completer,
-            WORD=False,
-            pattern=r"^[^\s@]*",
-        )
+        # Fuzzy matches for a fragment are a superset of the matches for any extension of
+        # it, so while the user keeps typing only the previous matches are searched.
+        # `(fragment, listing, matches in listing order)`, valid while `listing` is current.
+        self._narrowed: tuple[str, list[str], list[str]] | None = None
+        # Bumped on every path-cache refresh so cached `_is_completed_file` stats expire too.
+        self._cache_generation = 0
 
     @classmethod
     def _is_ignored(cls, name: str) -> bool:
@@ -112,14 +113,23 @@ class FileMentionCompleter(Completer):
             return True
         if name in cls._IGNORED_NAMES:
             return True
+        if name[-1] not in cls._IGNORED_LAST_CHARS:
+            return False
         return bool(cls._IGNORED_PATTERNS.fullmatch(name))
 
-    def _get_paths(self) -> list[str]:
-        fragment = self._fragment_hint or ""
+    def _get_paths(self, fragment: str) -> list[str]:
         if "/" not in fragment and len(fragment) < 3:
             return self._get_top_level_paths()
         return self._get_deep_paths()
 
+    def _candidate_paths(self, fragment: str) -> tuple[list[str], list[str]]:
+        """Return the current listing and the subset of it worth fuzzy-matching."""
+        listing = self._get_paths(fragment)
+        narrowed = self._narrowed
+        if narrowed is not None and narrowed[1] is listing and fragment.startswith(narrowed[0]):
+            return listing, narrowed[2]
+        return listing, listing
+
     def _get_top_level_paths(self) -> list[str]:
         now = time.monotonic()
         if now - self._top_cache_time <= self._refresh_interval:
@@ -127,11 +137,17 @@ class FileMentionCompleter(Completer):
 
         entries: list[str] = []
         try:
-            for entry in sorted(self._root.iterdir(), key=lambda p: p.name):
+            with os.scandir(self._root_str) as it:
+                dir_entries = sorted(it, key=lambda entry: entry.name)
+            for entry in dir_entries:
                 name = entry.name
                 if self._is_ignored(name):
                     continue
-                entries.append(f"{name}/" if entry.is_dir() else name)
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                entries.append(f"{name}/" if is_dir else name)
                 if len(entries) >= self._limit:
                     break
         except OSError:
@@ -139,49 +155,77 @@ class FileMentionCompleter(Completer):
 
         self._top_cached_paths = entries
         self._top_cache_time = now
+        self._cache_generation += 1
         return self._top_cached_paths
 
     def _get_deep_paths(self) -> list[str]:
         now = time.monotonic()
         if now - self._cache_time <= self._refresh_interval:
             return self._cached_paths
+        if not self._cache_time:
+            # Nothing to serve yet: build the first listing synchronously.
+            self._refresh_deep_paths()
+        elif not self._deep_refresh_in_flight:
+            # Serve the stale listing while a background walk replaces it, so large
+            # trees never block keystrokes in the prompt.
+            self._deep_refresh_in_flight = True
+            threading.Thread(
+                target=self._refresh_deep_paths, name="mention-paths", daemon=True
+            ).start()
+        return self._cached_paths
 
-        paths: list[str] = []
+    def _refresh_deep_paths(self) -> None:
         try:
-            for current_root, dirs, files in os.walk(self._root):
-                relative_root = Path(current_root).relative_to(self._root)
+            now = time.monotonic()
+            paths = self._walk_deep_paths()
+            # Plain attribute stores are atomic; readers see either listing in full.
+            self._cached_paths = paths
+            self._cache_time = now
+            self._cache_generation += 1
+        finally:
+            self._deep_refresh_in_flight = False
 
-                dirs[:] = sorted(d for d in dirs if not self._is_ignored(d))
+    def _walk_deep_paths(self) -> list[str]:
+        paths: list[str] = []
+        # Same order as a top-down os.walk: a directory, its files, then its subdirectories.
+        stack: list[tuple[str, str]] = [("", self._root_str)]
+        while stack and len(paths) < self._limit:
+            relative_root, dir_path = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            if relative_root:
+                paths.append(relative_root + "/")
+                if len(paths) >= self._limit:
+                    break
 
-                if relative_root.parts and any(
-                    self._is_ignored(part) for part in relative_root.parts
-                ):
-                    dirs[:] = []
+            dirs: list[str] = []
+            files: list[str] = []
+            for entry in entries:
+                name = entry.name
+                if self._is_ignored(name):
                     continue
-
-                if relative_root.parts:
-                    paths.append(relative_root.as_posix() + "/")
-                    if len(paths) >= self._limit:
-                        break
-
-                for file_name in sorted(files):
-                    if self._is_ignored(file_name):
-                        continue
-                    relative = (relative_root / file_name).as_posix()
-                    if not relative:
-                        continue
-                    paths.append(relative)
-                    if len(paths) >= self._limit:
-                        break
-
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(name)
+                elif not entry.is_symlink():  # os.walk does not descend into links
+                    dirs.append(name)
+
+            prefix = relative_root + "/" if relative_root else ""
+            for file_name in sorted(files):
+                paths.append(prefix + file_name)
                 if len(paths) >= self._limit:
                     break
-        except OSError:
-            return self._cached_paths
-
-        self._cached_paths = paths
-        self._cache_time = now
-        return self._cached_paths
+            stack.extend(
+                (prefix + name, os.path.join(dir_path, name)) for name in sorted(dirs, reverse=True)
+            )
+        return paths
 
     @staticmethod
     def _extract_fragment(text: str) -> str | None:
@@ -204,13 +248,9 @@ class FileMentionCompleter(Completer):
         return fragment
 
     def _is_completed_file(self, fragment: str) -> bool:
-        candidate = fragment.rstrip("/")
-        if not candidate:
-            return False
-        try:
-            return (self._root / candidate).is_file()
-        except OSError:
+        if not fragment or fragment.endswith("/"):
             return False
+        return _stat_is_file(self._root_str, fragment, self._cache_generation)
 
     def get_completions(self, document, complete_event):  # type: ignore[override]
         fragment = self._extract_fragment(document.text_before_cursor)
@@ -218,26 +258,43 @@ class FileMentionCompleter(Completer):
             return
         if self._is_completed_file(fragment):
             return
+        if not fragment:
+            # Everything matches an empty fragment and ranks equal, so fuzzy scoring
+            # would only return the listing in its own order.
+            for path in self._get_paths(fragment):
+                yield Completion(text=path, start_position=0, display=path)
+            return
 
+        listing, searched = self._candidate_paths(fragment)
+        fuzzy = FuzzyCompleter(
+            WordCompleter(searched, WORD=False, pattern=self._FRAGMENT_PATTERN),
+            WORD=False,
+            pattern=self._FUZZY_PATTERN,
+        )
         mention_doc = Document(text=fragment, cursor_position=len(fragment))
-        self._fragment_hint = fragment
-        try:
-            candidates = list(self._fuzzy.get_completions(mention_doc, complete_event))
-
-            frag_lower = fragment.lower()
-
-            def _rank(completion: Completion) -> tuple[int]:
-                path = completion.text
-                base = path.rstrip("/").split("/")[-1].lower()
-                if base.startswith(frag_lower):
-                    cat = 0
-                elif frag_lower in base:
-                    cat = 1
-                else:
-                    cat = 2
-                return (cat,)
-
-            candidates.sort(key=_rank)
-            yield from candidates
-        finally:
-            self._fragment_hint = None
+        candidates = list(fuzzy.get_completions(mention_doc, complete_event))
+        matched = {completion.text for completion in candidates}
+        self._narrowed = (fragment, listing, [p for p in searched if p in matched])
+
+        frag_lower = fragment.lower()
+
+        def _rank(completion: Completion) -> tuple[int]:
+            path = completion.text
+            base = path.rstrip("/").split("/")[-1].lower()
+            if base.startswith(frag_lower):
+                cat = 0
+            elif frag_lower in base:
+                cat = 1
+            else:
+                cat = 2
+            return (cat,)
+
+        candidates.sort(key=_rank)
+        yield from candidates
+
+
+@functools.lru_cache(maxsize=256)
+def _stat_is_file(root_str: str, candidate: str, generation: int) -> bool:
+    """`os.path.isfile` under `root_str`; `generation` only expires stale entries."""
+    del generation  # only part of the cache key
+    return os.path.isfile(os.path.join(root_str, candidate))
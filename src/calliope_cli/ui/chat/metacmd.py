@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import inspect
 from collections.abc import Awaitable, Callable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, overload
 
 if TYPE_CHECKING:
@@ -17,19 +18,30 @@ class MetaCommand:
     description: str
     func: MetaCmdFunc
     aliases: list[str]
-
-    def all_names(self) -> list[str]:
-        return [self.name, *self.aliases]
-
-    def slash_name(self) -> str:
-        """Display name in "/name (alias1, alias2)" format for completions."""
-        if self.aliases:
-            return f"/{self.name} ({', '.join(self.aliases)})"
-        return f"/{self.name}"
+    all_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    lower_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    slash_name: str = field(init=False, repr=False, compare=False)
+    is_coroutine: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Derived once here; completions read them on every keystroke.
+        all_names = (self.name, *self.aliases)
+        object.__setattr__(self, "all_names", all_names)
+        # Lowercased for case-insensitive prefix matching in completions.
+        object.__setattr__(self, "lower_names", tuple(n.lower() for n in all_names))
+        # Display name in "/name (alias1, alias2)" format for completions.
+        object.__setattr__(
+            self,
+            "slash_name",
+            f"/{self.name} ({', '.join(self.aliases)})" if self.aliases else f"/{self.name}",
+        )
+        # Resolved at registration so dispatch branches on a flag, not on the result.
+        object.__setattr__(self, "is_coroutine", inspect.iscoroutinefunction(self.func))
 
 
 _meta_commands: dict[str, MetaCommand] = {}
 _meta_command_aliases: dict[str, MetaCommand] = {}
+_sorted_meta_commands: tuple[MetaCommand, ...] = ()
 
 
 def get_meta_command(name: str) -> MetaCommand | None:
@@ -40,6 +52,11 @@ def get_meta_commands() -> list[MetaCommand]:
     return list(_meta_commands.values())
 
 
+def get_sorted_meta_commands() -> tuple[MetaCommand, ...]:
+    """Registered commands sorted by name; rebuilt on registration, not per call."""
+    return _sorted_meta_commands
+
+
 @overload
 def meta_command(func: MetaCmdFunc, /) -> MetaCmdFunc: ...
 
@@ -59,6 +76,7 @@ def meta_command(
     """Decorator to register a meta command with optional name/aliases."""
 
     def _register(f: MetaCmdFunc):
+        global _sorted_meta_commands
         primary = name or f.__name__
         alias_list = list(aliases) if aliases else []
 
@@ -72,6 +90,7 @@ def meta_command(
         _meta_command_aliases[primary] = cmd
         for alias in alias_list:
             _meta_command_aliases[alias] = cmd
+        _sorted_meta_commands = tuple(sorted(_meta_commands.values(), key=lambda c: c.name))
         return f
 
     if func is not None:
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from rich.console import Console
-from rich.markdown import Markdown
+import functools
+from typing import TYPE_CHECKING
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.cache
+def _console() -> Console:
+    from rich.console import Console
+
+    return Console()
 
 
 def render_markdown(text: str) -> None:
-    console.print(Markdown(text))
+    from rich.markdown import Markdown
+
+    _console().print(Markdown(text))
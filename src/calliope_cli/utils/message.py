@@ -7,7 +7,11 @@ def message_extract_text(message: Message) -> str:
     """Collapse a message's text parts into a plain string."""
     if isinstance(message.content, str):
         return message.content
-    return "\n".join(part.text for part in message.content if isinstance(part, TextPart))
+    return "\n".join(
+        part.text
+        for part in message.content
+        if type(part) is TextPart or isinstance(part, TextPart)
+    )
 
 
 def message_stringify(message: Message) -> str:
@@ -15,13 +19,13 @@ def message_stringify(message: Message) -> str:
     if isinstance(message.content, str):
         return message.content
 
-    parts: list[str] = []
-    for part in message.content:
-        match part:
-            case TextPart():
-                parts.append(part.text)
-            case ContentPart():
-                parts.append(f"[{part.type}]")
-            case _:
-                parts.append(str(part))
-    return "".join(parts)
+    return "".join(map(_stringify_part, message.content))
+
+
+def _stringify_part(part: ContentPart) -> str:
+    # Exact type checks first: isinstance on pydantic models goes through ABCMeta.
+    if type(part) is TextPart or isinstance(part, TextPart):
+        return part.text
+    if isinstance(part, ContentPart):
+        return f"[{part.type}]"
+    return str(part)
@@ -1,9 +1,35 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 
 def shorten_middle(text: str, width: int = 80) -> str:
-    """Shorten a long string keeping both ends."""
-    if len(text) <= width:
+    """Shorten a long string keeping both ends, measured in terminal cells."""
+    if text.isascii():
+        if len(text) <= width:
+            return text
+        keep = (width - 3) // 2
+        return text[:keep] + "..." + text[len(text) - keep :]
+
+    # Wide (CJK, emoji) and zero-width characters do not occupy one cell each.
+    from rich.cells import cell_len
+
+    if cell_len(text) <= width:
         return text
     keep = (width - 3) // 2
-    return text[:keep] + "..." + text[-keep:]
+    head = _fit_cells(text, keep)
+    tail = _fit_cells(reversed(text), keep)
+    return text[:head] + "..." + text[len(text) - tail :]
+
+
+def _fit_cells(chars: Iterable[str], cells: int) -> int:
+    """Number of leading `chars` that fit in `cells` terminal cells."""
+    from rich.cells import get_character_cell_size
+
+    count = 0
+    for char in chars:
+        cells -= get_character_cell_size(char)
+        if cells < 0:
+            break
+        count += 1
+    return count
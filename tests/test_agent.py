@@ -0,0 +1,14 @@
+from pathlib import Path
+
+from calliope_cli.core.agent import _load_system_prompt
+from calliope_cli.core.runtime import BuiltinSystemPromptArgs
+
+
+def test_system_prompt_normalizes_crlf(tmp_path: Path):
+    prompt = tmp_path / "system.md"
+    prompt.write_bytes(b"You are ${ROLE}.\r\nNow: ${CALLIOPE_NOW}\r\n")
+    builtin_args = BuiltinSystemPromptArgs(CALLIOPE_NOW="today", CALLIOPE_WORK_DIR=tmp_path)
+
+    rendered = _load_system_prompt(prompt, {"ROLE": "a writer"}, builtin_args)
+
+    assert rendered == "You are a writer.\nNow: today"
@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import pytest
+
+from calliope_cli.agentspec import DEFAULT_AGENT_FILE, load_agent_spec
+from calliope_cli.exception import AgentSpecError
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_extend_chain_merges_from_base_to_child(tmp_path: Path):
+    _write(
+        tmp_path / "base" / "agent.yaml",
+        """
+version: 1
+agent:
+  name: base
+  system_prompt_path: ./system.md
+  system_prompt_args: {TONE: calm, AUDIENCE: adults}
+  tools: [a:A, b:B]
+""",
+    )
+    _write(
+        tmp_path / "middle" / "agent.yaml",
+        """
+version: 1
+agent:
+  extend: ../base/agent.yaml
+  name: middle
+  system_prompt_args: {TONE: playful}
+  exclude_tools: [b:B]
+""",
+    )
+    child = _write(
+        tmp_path / "child.yaml",
+        """
+version: 1
+agent:
+  extend: ./middle/agent.yaml
+  system_prompt_args: {AUDIENCE: kids}
+  tools: [c:C]
+""",
+    )
+
+    spec = load_agent_spec(child)
+
+    assert spec.name == "middle"
+    # Relative paths resolve against the file that declares them.
+    assert spec.system_prompt_path.resolve() == (tmp_path / "base" / "system.md").resolve()
+    assert spec.system_prompt_args == {"TONE": "playful", "AUDIENCE": "kids"}
+    assert spec.tools == ["c:C"]
+    assert spec.exclude_tools == ["b:B"]
+
+
+def test_extend_default_uses_builtin_agent(tmp_path: Path):
+    child = _write(
+        tmp_path / "agent.yaml",
+        """
+version: 1
+agent:
+  extend: default
+  name: custom
+""",
+    )
+
+    spec = load_agent_spec(child)
+    default = load_agent_spec(DEFAULT_AGENT_FILE)
+
+    assert spec.name == "custom"
+    assert spec.system_prompt_path == default.system_prompt_path
+    assert spec.tools == default.tools
+
+
+def test_circular_extend_is_rejected(tmp_path: Path):
+    first = _write(tmp_path / "first.yaml", "version: 1\nagent:\n  extend: ./second.yaml\n")
+    _write(tmp_path / "second.yaml", "version: 1\nagent:\n  extend: ./first.yaml\n")
+
+    with pytest.raises(AgentSpecError, match="Circular"):
+        load_agent_spec(first)
+
+
+def test_circular_extend_through_parent_dir_is_rejected(tmp_path: Path):
+    spec = _write(tmp_path / "a" / "agent.yaml", "version: 1\nagent:\n  extend: ../a/agent.yaml\n")
+
+    with pytest.raises(AgentSpecError, match="Circular"):
+        load_agent_spec(spec)
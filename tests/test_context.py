@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+from kosong.message import Message
+
+from calliope_cli.core.context import Context
+
+
+@pytest.mark.asyncio
+async def test_append_batch_persists_messages_in_order(tmp_path: Path):
+    backend = tmp_path / "context.jsonl"
+    context = Context(file_backend=backend)
+    await context.append_message(Message(role="user", content="question"))
+    await context.append_batch(
+        [
+            Message(role="assistant", content="calling a tool"),
+            Message(role="tool", content="tool output", tool_call_id="call-1"),
+        ],
+        token_count=42,
+    )
+    await context.append_batch([Message(role="assistant", content="answer")])
+
+    restored = Context(file_backend=backend)
+    assert await restored.restore()
+
+    assert [msg.content for msg in restored.history] == [
+        "question",
+        "calling a tool",
+        "tool output",
+        "answer",
+    ]
+    assert restored.history == context.history
+    assert restored.token_count == context.token_count == 42
+
+
+@pytest.mark.asyncio
+async def test_append_batch_without_messages_only_records_usage(tmp_path: Path):
+    backend = tmp_path / "context.jsonl"
+    context = Context(file_backend=backend)
+
+    await context.append_batch([])
+    assert not backend.exists()
+
+    await context.append_batch([], token_count=7)
+    restored = Context(file_backend=backend)
+    assert await restored.restore()
+    assert restored.history == []
+    assert restored.token_count == 7
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import pytest
+from kosong.tooling import ToolOk
+
+from calliope_cli.core.runtime import BuiltinSystemPromptArgs
+from calliope_cli.tools.file.read import MAX_BYTES, Params, ReadFile
+
+
+@pytest.fixture
+def read_file(tmp_path: Path) -> ReadFile:
+    return ReadFile(BuiltinSystemPromptArgs(CALLIOPE_NOW="now", CALLIOPE_WORK_DIR=tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_multi_megabyte_line_is_cut_to_max_bytes(read_file: ReadFile, tmp_path: Path):
+    path = tmp_path / "long.txt"
+    path.write_bytes(b"x" * (8 << 20) + b"\nsecond\n")
+
+    result = await read_file(Params(path=str(path)))
+
+    assert isinstance(result, ToolOk)
+    assert isinstance(result.output, str)
+    assert result.output == f"{1:6d}\t" + "x" * MAX_BYTES
+
+
+@pytest.mark.asyncio
+async def test_multi_megabyte_line_is_skipped_by_offset(read_file: ReadFile, tmp_path: Path):
+    path = tmp_path / "long.txt"
+    path.write_bytes(b"x" * (8 << 20) + b"\nsecond\n")
+
+    result = await read_file(Params(path=str(path), line_offset=2))
+
+    assert isinstance(result, ToolOk)
+    assert result.output == f"{2:6d}\tsecond\n"
+
+
+@pytest.mark.asyncio
+async def test_crlf_lines_are_normalized(read_file: ReadFile, tmp_path: Path):
+    path = tmp_path / "crlf.txt"
+    path.write_bytes(b"a\r\nb\r\nc")
+
+    result = await read_file(Params(path=str(path)))
+
+    assert isinstance(result, ToolOk)
+    assert result.output == "     1\ta\n     2\tb\n     3\tc"
+    assert "3 lines read" in result.message
+
+
+@pytest.mark.asyncio
+async def test_window_is_limited_by_n_lines(read_file: ReadFile, tmp_path: Path):
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"a\nb\nc\n")
+
+    result = await read_file(Params(path=str(path), line_offset=2, n_lines=1))
+
+    assert isinstance(result, ToolOk)
+    assert result.output == "     2\tb\n"
+    assert "starting at line 2" in result.message
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", [b"", b"a\nb\n"])
+async def test_offset_past_end_reads_nothing(read_file: ReadFile, tmp_path: Path, content: bytes):
+    path = tmp_path / "short.txt"
+    path.write_bytes(content)
+
+    result = await read_file(Params(path=str(path), line_offset=9))
+
+    assert isinstance(result, ToolOk)
+    assert result.output == ""
+    assert result.message == "No lines read from file."
+
+
+@pytest.mark.asyncio
+async def test_lone_cr_breaks_lines(read_file: ReadFile, tmp_path: Path):
+    path = tmp_path / "mac.txt"
+    path.write_bytes(b"a\rb\r\nc\rd")
+
+    result = await read_file(Params(path=str(path), line_offset=2, n_lines=2))
+
+    assert isinstance(result, ToolOk)
+    assert result.output == "     2\tb\n     3\tc\n"
+    assert "2 lines read" in result.message
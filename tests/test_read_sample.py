@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import Literal
+
+import pytest
+from kosong.tooling import ToolOk
+
+from calliope_cli.core.runtime import BuiltinSystemPromptArgs
+from calliope_cli.tools.file.read_sample import Params, ReadSample
+
+
+@pytest.fixture
+def read_sample(tmp_path: Path) -> ReadSample:
+    return ReadSample(BuiltinSystemPromptArgs(CALLIOPE_NOW="now", CALLIOPE_WORK_DIR=tmp_path))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("newline", [b"\r", b"\r\n", b"\n"])
+async def test_tail_splits_lines_like_text_mode(
+    read_sample: ReadSample, tmp_path: Path, newline: bytes
+):
+    path = tmp_path / "sample.txt"
+    path.write_bytes(newline.join(b"line %d" % i for i in range(1, 11)))
+
+    result = await read_sample(Params(path=str(path), position="tail", lines=2))
+
+    assert isinstance(result, ToolOk)
+    assert result.output == "     9\tline 9\n    10\tline 10"
+    assert "starting at line 9" in result.message
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("position", "first_line"),
+    [("head", 1), ("middle", 4), ("tail", 8)],
+)
+async def test_windows_over_lf_file(
+    read_sample: ReadSample,
+    tmp_path: Path,
+    position: Literal["head", "middle", "tail"],
+    first_line: int,
+):
+    path = tmp_path / "sample.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(1, 11)), encoding="utf-8")
+
+    result = await read_sample(Params(path=str(path), position=position, lines=3))
+
+    assert isinstance(result, ToolOk)
+    assert result.output == "".join(
+        f"{i:6d}\tline {i}\n" for i in range(first_line, first_line + 3)
+    )
+    assert f"from {position} starting at line {first_line}" in result.message
+
+
+@pytest.mark.asyncio
+async def test_empty_file_reads_nothing(read_sample: ReadSample, tmp_path: Path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    result = await read_sample(Params(path=str(path), position="tail", lines=3))
+
+    assert isinstance(result, ToolOk)
+    assert result.output == ""
+    assert result.message.startswith("No lines read from file")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (b"a\rb\nc\nd\n", "     1\ta\n     2\tb\n"),
+        (b"a\nb\nc\rd\n", "     1\ta\n     2\tb\n"),
+        (b"a\r\nb\r\nc\rd\n", "     1\ta\n     2\tb\n"),
+    ],
+)
+async def test_head_honours_lone_cr_only_where_read(
+    read_sample: ReadSample, tmp_path: Path, data: bytes, expected: str
+):
+    path = tmp_path / "sample.txt"
+    path.write_bytes(data)
+
+    result = await read_sample(Params(path=str(path), position="head", lines=2))
+
+    assert isinstance(result, ToolOk)
+    assert result.output == expected
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+from calliope_cli.core.runtime import BuiltinSystemPromptArgs
+
+
+def test_missing_work_dir_has_empty_listing_and_no_agents_md(tmp_path: Path):
+    args = BuiltinSystemPromptArgs(CALLIOPE_NOW="now", CALLIOPE_WORK_DIR=tmp_path / "missing")
+
+    assert args.CALLIOPE_WORK_DIR_LS == ""
+    assert args.CALLIOPE_AGENTS_MD == ""
+
+
+def test_work_dir_listing_and_agents_md(tmp_path: Path):
+    (tmp_path / "AGENTS.md").write_text("  be concise\n", encoding="utf-8")
+    args = BuiltinSystemPromptArgs(CALLIOPE_NOW="now", CALLIOPE_WORK_DIR=tmp_path)
+
+    assert args.CALLIOPE_WORK_DIR_LS.endswith(" AGENTS.md")
+    assert args.CALLIOPE_AGENTS_MD == "be concise"
@@ -0,0 +1,140 @@
+import re
+from pathlib import Path
+
+import pytest
+from kosong.tooling import ToolOk
+
+from calliope_cli.core.runtime import BuiltinSystemPromptArgs
+from calliope_cli.tools.file.split_to_workspace import (
+    _MMAP_THRESHOLD,
+    Params,
+    SplitToWorkspace,
+    _compile_split,
+    _find_matches,
+    _line_start_literal,
+)
+
+
+@pytest.fixture
+def split(tmp_path: Path) -> SplitToWorkspace:
+    return SplitToWorkspace(BuiltinSystemPromptArgs(CALLIOPE_NOW="now", CALLIOPE_WORK_DIR=tmp_path))
+
+
+def _chapters(workspace: Path) -> dict[str, str]:
+    return {p.name: p.read_text(encoding="utf-8") for p in sorted(workspace.iterdir())}
+
+
+@pytest.mark.parametrize(
+    ("split_pattern", "literal"),
+    [
+        (r"^## ", "## "),
+        (r"^Chapter\ ", "Chapter "),
+        (r"^\#\# ", "## "),
+        (r"^Chapter \d+", None),
+        (r"## ", None),
+        (r"^\w", None),
+    ],
+)
+def test_line_start_literal(split_pattern: str, literal: str | None):
+    assert _line_start_literal(split_pattern) == literal
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "## a\nbody\n## b\n",
+        "preface\n## a\n## ## b\nx ## c\n## d",
+        "## \n## \n## ",
+        "no headings here\n",
+    ],
+)
+@pytest.mark.parametrize("split_pattern", [r"^## ", r"^## ## "])
+def test_find_matches_agrees_with_finditer(content: str, split_pattern: str):
+    pattern = _compile_split(split_pattern)
+
+    found = _find_matches(pattern, content, _line_start_literal(split_pattern))
+
+    expected = list(pattern.finditer(content))
+    assert [m.span() for m in found] == [m.span() for m in expected]
+    assert [m.group(1) for m in found] == [m.group(1) for m in expected]
+
+
+def test_find_matches_skips_overlapping_candidates():
+    # `^a\na` matches at line 0 and consumes line 1's candidate start.
+    pattern = re.compile(r"(^a\na)", flags=re.MULTILINE)
+
+    found = _find_matches(pattern, "a\na\na\na", "a\na")
+
+    assert [m.span() for m in found] == [(0, 3), (4, 7)]
+
+
+@pytest.mark.asyncio
+async def test_pattern_with_own_groups_uses_whole_heading_as_title(
+    split: SplitToWorkspace, tmp_path: Path
+):
+    source = tmp_path / "book.txt"
+    source.write_text("intro\nChapter 1 Dawn\nfirst\nChapter 2 Dusk\nsecond\n", encoding="utf-8")
+
+    result = await split(
+        Params(
+            source_path=str(source),
+            workspace_path="ws",
+            split_pattern=r"^(Chapter) (\d+)",
+            encoding="utf-8",
+        )
+    )
+
+    assert isinstance(result, ToolOk)
+    assert _chapters(tmp_path / "ws") == {
+        "000_preface.md": "intro",
+        "001_Chapter_1.md": "# Chapter 1\n\n Dawn\nfirst\n",
+        "002_Chapter_2.md": "# Chapter 2\n\n Dusk\nsecond\n",
+    }
+
+
+@pytest.mark.asyncio
+async def test_large_source_uses_byte_path(split: SplitToWorkspace, tmp_path: Path):
+    body = "汉字 text line\n" * (_MMAP_THRESHOLD // 16)
+    source = tmp_path / "big.txt"
+    source.write_text(f"## 第一章\n{body}## 第二章\n{body}", encoding="utf-8")
+    assert source.stat().st_size > _MMAP_THRESHOLD
+
+    result = await split(
+        Params(
+            source_path=str(source),
+            workspace_path="ws",
+            split_pattern=r"^## ",
+            encoding="utf-8",
+        )
+    )
+
+    assert isinstance(result, ToolOk)
+    assert isinstance(result.output, str)
+    assert "into 2 file(s)" in result.output
+    assert _chapters(tmp_path / "ws") == {
+        "001_##.md": f"# ##\n\n第一章\n{body}",
+        "002_##.md": f"# ##\n\n第二章\n{body}",
+    }
+
+
+@pytest.mark.asyncio
+async def test_large_source_with_non_ascii_literal(split: SplitToWorkspace, tmp_path: Path):
+    body = "text line\n" * (_MMAP_THRESHOLD // 10)
+    source = tmp_path / "big.txt"
+    source.write_text(f"第一章\n{body}第二章\n{body}", encoding="utf-8")
+    assert source.stat().st_size > _MMAP_THRESHOLD
+
+    result = await split(
+        Params(
+            source_path=str(source),
+            workspace_path="ws",
+            split_pattern=r"^第",
+            encoding="utf-8",
+        )
+    )
+
+    assert isinstance(result, ToolOk)
+    assert _chapters(tmp_path / "ws") == {
+        "001_第.md": f"# 第\n\n一章\n{body}",
+        "002_第.md": f"# 第\n\n二章\n{body}",
+    }